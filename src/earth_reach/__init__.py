@@ -5,11 +5,16 @@ Dual-LLM framework for generating natural language descriptions of meteorologica
 data visualizations, making weather charts accessible to blind and low-vision scientists.
 """
 
-from earth_reach.core.evaluator import EvaluatorAgent
-from earth_reach.core.generator import GeneratorAgent
-from earth_reach.core.llm import GeminiLLM, GroqLLM, OpenAILLM
-from earth_reach.core.orchestrator import Orchestrator
-from earth_reach.main import EarthReachAgent
+import importlib
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from earth_reach.core.evaluator import EvaluatorAgent
+    from earth_reach.core.generator import GeneratorAgent
+    from earth_reach.core.llm import GeminiLLM, GroqLLM, OpenAILLM
+    from earth_reach.core.orchestrator import Orchestrator
+    from earth_reach.main import EarthReachAgent
 
 __all__ = [
     "EarthReachAgent",
@@ -20,3 +25,29 @@ __all__ = [
     "OpenAILLM",
     "Orchestrator",
 ]
+
+# Public names are imported on first access, so that importing the package, e.g. to
+# run the CLI, doesn't load earthkit and the other heavy dependencies upfront
+_LAZY_IMPORTS = {
+    "EarthReachAgent": "earth_reach.main",
+    "EvaluatorAgent": "earth_reach.core.evaluator",
+    "GeminiLLM": "earth_reach.core.llm",
+    "GeneratorAgent": "earth_reach.core.generator",
+    "GroqLLM": "earth_reach.core.llm",
+    "OpenAILLM": "earth_reach.core.llm",
+    "Orchestrator": "earth_reach.core.orchestrator",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
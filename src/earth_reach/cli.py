@@ -1,27 +1,34 @@
 #!/usr/bin/env python3
 """
 CLI entrypoint for generating weather chart descriptions.
+
+The agents and their dependencies are imported by the commands using them, so that
+showing the help doesn't pay for loading them.
 """
 
+import asyncio
 import os
 import sys
 
+from collections.abc import Callable
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import fire
 
-from PIL import Image
-
-from earth_reach.config.criteria import QualityCriteria
+from earth_reach.config.criteria import VALID_CRITERIA, QualityCriteria
 from earth_reach.config.logging import get_logger
-from earth_reach.core.evaluator import EvaluatorAgent
-from earth_reach.core.generator import GeneratorAgent
-from earth_reach.core.llm import create_llm
-from earth_reach.core.orchestrator import Orchestrator
 from earth_reach.core.prompts.generator import get_default_generator_user_prompt
 
+if TYPE_CHECKING:
+    from earth_reach.core.llm import LLMInterface
+
 logger = get_logger(__name__)
 
+OUTPUT_BUFFER_SIZE = 64 * 1024
+
+_VALID_SUFFIXES: frozenset[str] = frozenset({".jpg", ".jpeg", ".png"})
+
 
 def load_prompt_from_file(file_path: str) -> str:
     """
@@ -38,15 +45,15 @@ def load_prompt_from_file(file_path: str) -> str:
         IOError: If file can't be read
         ValueError: If file is empty
     """
-    if not os.path.isfile(file_path):
+    path = Path(file_path)
+    if not path.is_file():
         raise FileNotFoundError(f"Prompt file not found: {file_path}")
 
     try:
-        with open(file_path, encoding="utf-8") as f:
-            content = f.read().strip()
-            if not content:
-                raise ValueError(f"Prompt file is empty: {file_path}")
-            return content
+        content = path.read_text(encoding="utf-8").strip()
+        if not content:
+            raise ValueError(f"Prompt file is empty: {file_path}")
+        return content
     except Exception as e:
         raise OSError(f"Failed to read prompt file '{file_path}': {e}") from e
 
@@ -114,28 +121,45 @@ def resolve_description(
         return description
 
     if description_file_path:
-        if not os.path.exists(description_file_path):
+        path = Path(description_file_path)
+        if not path.exists():
             raise FileNotFoundError(
                 f"Description file not found: {description_file_path}",
             )
 
         try:
-            with open(description_file_path, encoding="utf-8") as file:
-                return file.read().strip()
+            return path.read_text(encoding="utf-8").strip()
         except Exception as e:
             raise ValueError(f"Error reading description file: {e}") from e
 
     return None
 
 
-def get_valid_criteria() -> list[str]:
+def get_valid_criteria() -> frozenset[str]:
+    """
+    Get set of valid evaluation criteria.
+
+    Returns:
+        frozenset[str]: Set of valid criteria names
+    """
+    return VALID_CRITERIA
+
+
+def _log_nothing(*args: object, **kwargs: object) -> None:
+    """Discard a verbose log message."""
+
+
+def get_verbose_logger(verbose: bool) -> Callable[..., None]:
     """
-    Get list of valid evaluation criteria.
+    Get the function logging verbose progress messages.
+
+    Args:
+        verbose (bool): Whether verbose output is enabled
 
     Returns:
-        List[str]: List of valid criteria names
+        Callable[..., None]: logger.info if verbose output is enabled, a no-op otherwise
     """
-    return QualityCriteria.list()
+    return logger.info if verbose else _log_nothing
 
 
 def validate_image_path(image_path: str) -> Path:
@@ -160,16 +184,105 @@ def validate_image_path(image_path: str) -> Path:
     if not path.is_file():
         raise ValueError(f"Path is not a file: {image_path}")
 
-    valid_extensions = {".jpg", ".jpeg", ".png", ".JPG", ".JPEG", ".PNG"}
-    if path.suffix not in valid_extensions:
+    if path.suffix.lower() not in _VALID_SUFFIXES:
         raise ValueError(
             f"Unsupported image format: {path.suffix}. "
-            f"Supported formats: {', '.join(sorted(valid_extensions))}",
+            f"Supported formats: {', '.join(sorted(_VALID_SUFFIXES))}",
         )
 
     return path
 
 
+async def agenerate_descriptions(
+    image_paths: list[Path],
+    llm: "LLMInterface",
+    system_prompt: str | None,
+    user_prompt: str,
+    simple: bool = False,
+    max_iterations: int = 3,
+    criteria_threshold: int = 4,
+    max_concurrency: int = 4,
+    on_description: Callable[[Path, str], None] | None = None,
+) -> list[str | None]:
+    """
+    Concurrently generate descriptions for several weather chart images.
+
+    Args:
+        image_paths (list[Path]): Paths to the weather chart images
+        llm (LLMInterface): LLM shared by all the agents
+        system_prompt (str | None): System prompt text
+        user_prompt (str): User prompt text
+        simple (bool): Skip orchestrator to only use generator
+        max_iterations (int): Orchestrator maximum iterations for description generation
+        criteria_threshold (int): Minimum score for evaluation criteria to pass
+        max_concurrency (int): Maximum number of images described concurrently
+        on_description (Callable[[Path, str], None] | None): Optional callback called
+            with the image path and its description as soon as it is generated
+
+    Returns:
+        list[str | None]: Descriptions in the order of the image paths, or None for
+            images whose description failed
+    """
+    from PIL import Image
+
+    from earth_reach.core.evaluator import EvaluatorAgent
+    from earth_reach.core.generator import GeneratorAgent
+    from earth_reach.core.llm import async_client_scope
+    from earth_reach.core.orchestrator import Orchestrator
+    from earth_reach.core.utils import downscale_image
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    def load_image(image_path: Path) -> Image.Image:
+        with Image.open(image_path) as source_image:
+            source_image.load()
+        return downscale_image(source_image, llm.max_image_side)
+
+    async def describe(image_path: Path) -> str | None:
+        async with semaphore:
+            try:
+                # Decode and resize off the event loop, so the other requests keep going
+                image = await asyncio.to_thread(load_image, image_path)
+
+                generator = GeneratorAgent(
+                    llm=llm,
+                    system_prompt=system_prompt,
+                    user_prompt=user_prompt,
+                )
+                if simple:
+                    description = await generator.agenerate(
+                        image=image,
+                        return_intermediate_steps=False,
+                    )
+                else:
+                    orchestrator = Orchestrator(
+                        generator_agent=generator,
+                        evaluator_agent=EvaluatorAgent(
+                            criteria=QualityCriteria.list(),
+                            llm=llm,
+                        ),
+                        max_iterations=max_iterations,
+                        criteria_threshold=criteria_threshold,
+                    )
+                    description = await orchestrator.arun(image=image)
+
+                if not isinstance(description, str):
+                    raise TypeError(
+                        f"Expected string description, got {type(description)}"
+                    )
+            except Exception as e:
+                logger.error("Failed to describe %s: %s", image_path.name, e)
+                return None
+
+        logger.info("Generated description for: %s", image_path.name)
+        if on_description is not None:
+            on_description(image_path, description)
+        return description
+
+    async with async_client_scope():
+        return await asyncio.gather(*(describe(path) for path in image_paths))
+
+
 class CLI:
     """
     Command Line Interface for the Earth Reach Agent.
@@ -210,10 +323,21 @@ class CLI:
             ValueError: If arguments are invalid or conflicting
             RuntimeError: If description generation fails
         """
+        from PIL import Image
+
+        from earth_reach.core.evaluator import EvaluatorAgent
+        from earth_reach.core.generator import GeneratorAgent
+        from earth_reach.core.llm import create_llm
+        from earth_reach.core.orchestrator import Orchestrator
+        from earth_reach.core.utils import downscale_image
+
+        log = get_verbose_logger(verbose)
+
         logger.info("Starting description generation...")
         try:
             validated_image_path = validate_image_path(image_path)
-            image = Image.open(validated_image_path)
+            with Image.open(validated_image_path) as source_image:
+                source_image.load()
 
             system_prompt_text = resolve_prompt(
                 system_prompt,
@@ -230,16 +354,9 @@ class CLI:
                     "User prompt cannot be empty. Please provide a valid prompt.",
                 )
 
-            if verbose:
-                if system_prompt_text:
-                    logger.info(
-                        "System prompt length: %d characters", len(system_prompt_text)
-                    )
-
-                if user_prompt_text:
-                    logger.info(
-                        "User prompt length: %d characters", len(user_prompt_text)
-                    )
+            if system_prompt_text:
+                log("System prompt length: %d characters", len(system_prompt_text))
+            log("User prompt length: %d characters", len(user_prompt_text))
 
             logger.debug(
                 "CLI configuration for generation",
@@ -251,10 +368,10 @@ class CLI:
                 },
             )
             llm = create_llm()
+            # Downscale once for all the orchestration iterations
+            image = downscale_image(source_image, llm.max_image_side)
 
-            if verbose:
-                logger.info("Creating generator agent...")
-
+            log("Creating generator agent...")
             generator = GeneratorAgent(
                 llm=llm,
                 system_prompt=system_prompt_text,
@@ -262,17 +379,13 @@ class CLI:
             )
 
             if not simple:
-                if verbose:
-                    logger.info("Creating evaluator agent...")
-
+                log("Creating evaluator agent...")
                 evaluator = EvaluatorAgent(
                     criteria=QualityCriteria.list(),
                     llm=llm,
                 )
 
-                if verbose:
-                    logger.info("Creating orchestrator...")
-
+                log("Creating orchestrator...")
                 orchestrator = Orchestrator(
                     generator_agent=generator,
                     evaluator_agent=evaluator,
@@ -280,9 +393,7 @@ class CLI:
                     criteria_threshold=criteria_threshold,
                 )
 
-            if verbose:
-                logger.info("Generating description for: %s", validated_image_path.name)
-
+            log("Generating description for: %s", validated_image_path.name)
             if simple:
                 description = generator.generate(
                     image=image,
@@ -291,10 +402,10 @@ class CLI:
             else:
                 description = orchestrator.run(image=image)
 
-            if verbose and isinstance(description, str):
-                logger.info("Description generated successfully!")
-                logger.info("Description length: %d characters", len(description))
-                logger.info("-" * 50)
+            if isinstance(description, str):
+                log("Description generated successfully!")
+                log("Description length: %d characters", len(description))
+                log("-" * 50)
 
             print(description)
 
@@ -310,6 +421,150 @@ class CLI:
             logger.error("Unexpected error: %s", e, exc_info=True)
             sys.exit(1)
 
+    @staticmethod
+    def generate_batch(
+        images_dir: str,
+        output_file_path: str,
+        system_prompt: str | None = None,
+        system_prompt_file_path: str | None = None,
+        user_prompt: str | None = None,
+        user_prompt_file_path: str | None = None,
+        simple: bool = False,
+        max_iterations: int = 3,
+        criteria_threshold: int = 4,
+        max_concurrency: int = 4,
+        no_cache: bool = False,
+        verbose: bool = False,
+    ) -> None:
+        """
+        Generate scientific descriptions of all the weather chart images of a directory.
+
+        Images are described concurrently, and each description is written to the output
+        file under a heading with the image file name as soon as it is generated, so that
+        the descriptions already generated are kept if the run is interrupted.
+
+        Args:
+            images_dir (str): Path to the directory of weather chart images (JPEG or PNG)
+            output_file_path (str): Path to the text file to write the descriptions to
+            system_prompt (str | None): System prompt text (optional)
+            system_prompt_file_path (str | None): Path to system prompt file (optional)
+            user_prompt (str | None): User prompt text (optional)
+            user_prompt_file_path (str | None): Path to user prompt file (optional)
+            simple (bool): Skip orchestrator to only use generator (optional)
+            max_iterations (int): Orchestrator maximum iterations for description generation (default: 3)
+            criteria_threshold (int): Minimum score for evaluation criteria to pass (default: 4)
+            max_concurrency (int): Maximum number of images described concurrently (default: 4)
+            no_cache (bool): Disable the on-disk cache of LLM responses, which otherwise
+                lets reruns skip the LLM calls for unchanged images and prompts (optional)
+            verbose (bool): Enable verbose output (optional)
+
+        Returns:
+            None: Writes the generated weather descriptions to the output file
+
+        Raises:
+            FileNotFoundError: If the images directory or prompt files don't exist
+            ValueError: If arguments are invalid or conflicting
+        """
+        from earth_reach.core.cache import CachedLLM
+        from earth_reach.core.llm import create_llm
+
+        log = get_verbose_logger(verbose)
+
+        logger.info("Starting batch description generation...")
+        try:
+            if max_concurrency <= 0:
+                raise ValueError("max_concurrency must be greater than 0")
+
+            images_dir_path = Path(images_dir)
+            if not images_dir_path.is_dir():
+                raise FileNotFoundError(f"Images directory not found: {images_dir}")
+
+            image_paths = []
+            for path in sorted(images_dir_path.iterdir()):
+                try:
+                    image_paths.append(validate_image_path(str(path)))
+                except ValueError:
+                    continue
+
+            if not image_paths:
+                raise ValueError(f"No JPEG or PNG images found in: {images_dir}")
+
+            system_prompt_text = resolve_prompt(
+                system_prompt,
+                system_prompt_file_path,
+                None,
+            )
+            user_prompt_text = resolve_prompt(
+                user_prompt,
+                user_prompt_file_path,
+                get_default_generator_user_prompt(),
+            )
+            if not user_prompt_text:
+                raise ValueError(
+                    "User prompt cannot be empty. Please provide a valid prompt.",
+                )
+
+            log("Found %d images in %s", len(image_paths), images_dir)
+
+            logger.debug(
+                "CLI configuration for batch generation",
+                extra={
+                    "provider": os.getenv("LLM_PROVIDER", "groq"),
+                    "simple_mode": simple,
+                    "max_iterations": max_iterations,
+                    "criteria_threshold": criteria_threshold,
+                    "max_concurrency": max_concurrency,
+                    "cache": not no_cache,
+                },
+            )
+            llm: LLMInterface = create_llm()
+            if not no_cache:
+                llm = CachedLLM(llm)
+
+            with Path(output_file_path).open(
+                "w",
+                buffering=OUTPUT_BUFFER_SIZE,
+                encoding="utf-8",
+            ) as f:
+
+                def write_description(image_path: Path, description: str) -> None:
+                    f.write(f"# {image_path.name}\n\n{description}\n\n")
+                    f.flush()
+
+                descriptions = asyncio.run(
+                    agenerate_descriptions(
+                        image_paths,
+                        llm=llm,
+                        system_prompt=system_prompt_text,
+                        user_prompt=user_prompt_text,
+                        simple=simple,
+                        max_iterations=max_iterations,
+                        criteria_threshold=criteria_threshold,
+                        max_concurrency=max_concurrency,
+                        on_description=write_description,
+                    )
+                )
+
+            failed_count = descriptions.count(None)
+            if failed_count:
+                logger.warning(
+                    "Failed to describe %d of %d images", failed_count, len(image_paths)
+                )
+            logger.info(
+                "Wrote %d descriptions to %s",
+                len(image_paths) - failed_count,
+                output_file_path,
+            )
+
+            return
+
+        except (OSError, FileNotFoundError, ValueError) as e:
+            logger.error("Invalid input: %s", e, exc_info=True)
+            sys.exit(1)
+        except Exception as e:
+            logger.error("Unexpected error: %s", e, exc_info=True)
+            sys.exit(1)
+
     @staticmethod
     def evaluate(
         image_path: str,
@@ -336,13 +591,21 @@ class CLI:
             ValueError: If arguments are invalid or conflicting
             RuntimeError: If evaluation fails
         """
+        from PIL import Image
+
+        from earth_reach.core.evaluator import EvaluatorAgent
+        from earth_reach.core.llm import create_llm
+
+        log = get_verbose_logger(verbose)
+
         logger.info("Starting description evaluation...")
 
         if criteria is None:
-            criteria = ["coherence", "fluency", "consistency", "relevance"]
+            criteria = QualityCriteria.list()
         try:
             validated_image_path = validate_image_path(image_path)
-            image = Image.open(validated_image_path)
+            with Image.open(validated_image_path) as image:
+                image.load()
 
             description_text = resolve_description(
                 description,
@@ -353,8 +616,7 @@ class CLI:
                     "Description cannot be empty. Please provide a valid description.",
                 )
 
-            if verbose:
-                logger.info("Description length: %d characters", len(description_text))
+            log("Description length: %d characters", len(description_text))
 
             if not criteria or len(criteria) == 0:
                 raise ValueError("Criteria list cannot be empty.")
@@ -363,14 +625,11 @@ class CLI:
             invalid_criteria = [c for c in criteria if c not in valid_criteria]
             if invalid_criteria:
                 raise ValueError(
-                    f"Invalid criteria: {invalid_criteria}. Valid criteria are: {valid_criteria}",
+                    f"Invalid criteria: {invalid_criteria}. Valid criteria are: {QualityCriteria.list()}",
                 )
 
-            if verbose:
-                logger.info("Evaluation criteria: %s", ", ".join(criteria))
-
-            if verbose:
-                logger.info("Initializing LLM...")
+            log("Evaluation criteria: %s", ", ".join(criteria))
+            log("Initializing LLM...")
 
             logger.debug(
                 "CLI configuration for evaluation",
@@ -381,24 +640,21 @@ class CLI:
             )
             llm = create_llm()
 
-            if verbose:
-                logger.info("Creating evaluator agent...")
+            log("Creating evaluator agent...")
             evaluator = EvaluatorAgent(
                 criteria=criteria,
                 llm=llm,
             )
 
-            if verbose:
-                logger.info("Evaluating description for: %s", validated_image_path.name)
+            log("Evaluating description for: %s", validated_image_path.name)
             evaluation = evaluator.evaluate(
                 description=description_text,
                 image=image,
             )
 
-            if verbose:
-                logger.info("Evaluation completed successfully!")
-                logger.info("Number of criteria evaluated: %d", len(evaluation))
-                logger.info("-" * 50)
+            log("Evaluation completed successfully!")
+            log("Number of criteria evaluated: %d", len(evaluation))
+            log("-" * 50)
 
             for eval in evaluation:
                 print(f"Criterion: {eval.name}")
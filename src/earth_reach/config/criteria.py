@@ -5,10 +5,10 @@ Defines the evaluation criteria used to assess the quality of generated
 weather chart descriptions across multiple dimensions including coherence and accuracy.
 """
 
-from enum import Enum
+from enum import StrEnum
 
 
-class QualityCriteria(Enum):
+class QualityCriteria(StrEnum):
     COHERENCE = "coherence"
     FLUENCY = "fluency"
     CONSISTENCY = "consistency"
@@ -16,4 +16,10 @@ class QualityCriteria(Enum):
 
     @classmethod
     def list(cls) -> list[str]:
-        return [criterion.value for criterion in cls]
+        return list(_CRITERIA_VALUES)
+
+
+_CRITERIA_VALUES: tuple[str, ...] = tuple(
+    criterion.value for criterion in QualityCriteria
+)
+VALID_CRITERIA: frozenset[str] = frozenset(_CRITERIA_VALUES)
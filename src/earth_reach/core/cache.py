@@ -0,0 +1,187 @@
+"""
+LLM response cache module.
+
+Provides an LLMInterface wrapper persisting generated responses on disk, so that
+repeated runs over the same prompts and charts don't call the LLM API again.
+"""
+
+import os
+import tempfile
+
+from pathlib import Path
+
+from PIL import Image
+
+from earth_reach.config.logging import get_logger
+from earth_reach.core.llm import LLMInterface
+from earth_reach.core.utils import hash_key, image_digest
+
+logger = get_logger(__name__)
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "earth_reach" / "llm"
+
+
+class CachedLLM(LLMInterface):
+    """LLMInterface wrapper caching the responses of another LLM on disk."""
+
+    def __init__(self, llm: LLMInterface, cache_dir: str | Path | None = None) -> None:
+        """
+        Initialize the cache around an LLM instance.
+
+        Args:
+            llm (LLMInterface): The LLM whose responses should be cached.
+            cache_dir (str | Path | None): Directory where responses are stored.
+                Defaults to ~/.cache/earth_reach/llm.
+        """
+        self.llm = llm
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def provider_name(self) -> str:
+        return self.llm.provider_name
+
+    @property
+    def model_name(self) -> str | None:
+        return getattr(self.llm, "model_name", None)
+
+    @property
+    def max_image_side(self) -> int:  # type: ignore[override]
+        return self.llm.max_image_side
+
+    def generate(
+        self,
+        user_prompt: str,
+        system_prompt: str | None = None,
+        image: Image.Image | None = None,
+    ) -> str:
+        """
+        Return the cached response for the request, generating and storing it on a miss.
+
+        Args:
+            user_prompt (str): The prompt provided by the user to define the task.
+            system_prompt (str | None): An optional system prompt to guide the model's response.
+            image: Optional image to include in the request.
+
+        Returns:
+            str: The cached or generated response content from the LLM.
+
+        Raises:
+            ValueError: If user_prompt is empty/None or if the API response is empty.
+            RuntimeError: For other run-time errors.
+        """
+        path = self._get_cache_path(user_prompt, system_prompt, image)
+        cached = self._read(path)
+        if cached is not None:
+            return cached
+
+        response = self.llm.generate(
+            user_prompt=user_prompt,
+            system_prompt=system_prompt,
+            image=image,
+        )
+        self._write(path, response)
+        return response
+
+    async def agenerate(
+        self,
+        user_prompt: str,
+        system_prompt: str | None = None,
+        image: Image.Image | None = None,
+    ) -> str:
+        """
+        Asynchronously return the cached response, generating and storing it on a miss.
+
+        Args:
+            user_prompt (str): The prompt provided by the user to define the task.
+            system_prompt (str | None): An optional system prompt to guide the model's response.
+            image: Optional image to include in the request.
+
+        Returns:
+            str: The cached or generated response content from the LLM.
+
+        Raises:
+            ValueError: If user_prompt is empty/None or if the API response is empty.
+            RuntimeError: For other run-time errors.
+        """
+        path = self._get_cache_path(user_prompt, system_prompt, image)
+        cached = self._read(path)
+        if cached is not None:
+            return cached
+
+        response = await self.llm.agenerate(
+            user_prompt=user_prompt,
+            system_prompt=system_prompt,
+            image=image,
+        )
+        self._write(path, response)
+        return response
+
+    def discard_response(
+        self,
+        user_prompt: str,
+        system_prompt: str | None = None,
+        image: Image.Image | None = None,
+    ) -> None:
+        """
+        Delete the cached response to a request, so that it is generated again.
+
+        Args:
+            user_prompt (str): The prompt provided by the user to define the task.
+            system_prompt (str | None): An optional system prompt.
+            image: Optional image included in the request.
+        """
+        path = self._get_cache_path(user_prompt, system_prompt, image)
+        path.unlink(missing_ok=True)
+        logger.debug("Discarded cached LLM response", extra={"cache_file": path.name})
+        self.llm.discard_response(user_prompt, system_prompt, image)
+
+    def _get_cache_path(
+        self,
+        user_prompt: str,
+        system_prompt: str | None,
+        image: Image.Image | None,
+    ) -> Path:
+        """
+        Get the cache file of a request, keyed by the model, prompts and image content.
+
+        Args:
+            user_prompt (str): The prompt provided by the user to define the task.
+            system_prompt (str | None): An optional system prompt.
+            image: Optional image included in the request.
+
+        Returns:
+            Path: The path of the cache file for the request.
+        """
+        key = hash_key(
+            self.provider_name,
+            self.model_name or "",
+            system_prompt or "",
+            user_prompt,
+            image_digest(image) if image is not None else "",
+        )
+        return self.cache_dir / f"{key}.txt"
+
+    def _read(self, path: Path) -> str | None:
+        """Read a cached response, or return None if it isn't cached."""
+        try:
+            response = path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+        logger.debug("LLM response cache hit", extra={"cache_file": path.name})
+        return response
+
+    def _write(self, path: Path, response: str) -> None:
+        """Atomically store a response, so concurrent readers never see partial files."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(response)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            Path(tmp_path).unlink(missing_ok=True)
+            logger.warning("Failed to write LLM response cache: %s", e)
+
+    def __repr__(self) -> str:
+        return f"CachedLLM(llm={self.llm!r}, cache_dir={self.cache_dir})"
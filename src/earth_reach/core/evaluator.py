@@ -5,28 +5,35 @@ This module provides the main structure and classes for evaluating weather chart
 automatically against a set of quality criteria.
 """
 
-import re
+import asyncio
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import MISSING, dataclass, fields
-from io import BytesIO
-from typing import Any, Union, get_args, get_origin
-
-import earthkit.plots as ekp
+from typing import TYPE_CHECKING, Any, Union, get_args, get_origin
 
 from PIL import Image
-from PIL.ImageFile import ImageFile
 
+from earth_reach.config.criteria import QualityCriteria
 from earth_reach.config.logging import get_logger
 from earth_reach.core.generator import FigureMetadata
 from earth_reach.core.llm import LLMInterface, create_llm
 from earth_reach.core.prompts.evaluator import (
     get_default_criterion_evaluator_user_prompt,
 )
+from earth_reach.core.utils import compile_tags_pattern, extract_tags, figure_to_image
+
+if TYPE_CHECKING:
+    import earthkit.plots as ekp
 
 logger = get_logger(__name__)
 
+EVALUATION_REQUEST_TEMPLATE = (
+    "{user_prompt}\n\n# Description to evaluate\n\n{description}"
+    "\n\nPlease provide your evaluation of the description against the criteria."
+)
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CriterionEvaluatorOutput:
     """Structured representation of the criterion evaluator's output.
 
@@ -54,6 +61,11 @@ class CriterionEvaluatorOutput:
             raise ValueError("Score must be between 0 and 5.")
 
 
+_FIELDS_PATTERN = compile_tags_pattern(
+    field.name for field in fields(CriterionEvaluatorOutput)
+)
+
+
 class CriterionEvaluator:
     """Evaluator class for evaluating the quality of weather descriptions based on a specified criterion."""
 
@@ -64,7 +76,7 @@ class CriterionEvaluator:
         system_prompt: str | None,
         user_prompt: str,
     ) -> None:
-        if criterion not in ["coherence", "fluency", "consistency", "relevance"]:
+        if criterion not in QualityCriteria:
             raise ValueError(f"Unsupported criterion: {criterion}")
 
         self.criterion = criterion
@@ -75,36 +87,113 @@ class CriterionEvaluator:
     def evaluate(
         self,
         description: str,
-        figure: ekp.Figure | None = None,
-        image: ImageFile | None = None,
+        figure: "ekp.Figure | None" = None,
+        image: Image.Image | None = None,
+    ) -> CriterionEvaluatorOutput:
+        user_prompt = self._build_user_prompt(description, figure, image)
+        try:
+            response = self.llm.generate(
+                user_prompt=user_prompt,
+                system_prompt=self.system_prompt,
+            )
+        except Exception as e:
+            raise RuntimeError(f"Failed to generate response: {e}") from e
+
+        return self._process_response(response, user_prompt)
+
+    async def aevaluate(
+        self,
+        description: str,
+        figure: "ekp.Figure | None" = None,
+        image: Image.Image | None = None,
     ) -> CriterionEvaluatorOutput:
+        """
+        Asynchronously evaluate the description against the criterion.
+
+        Args:
+            description (str): The description to evaluate.
+            figure (Figure | None): Optional figure the description is about. Can't be used with image.
+            image (Image.Image | None): Optional image the description is about. Can't be used with figure.
+
+        Returns:
+            CriterionEvaluatorOutput: The evaluation result for the criterion.
+
+        Raises:
+            ValueError: If both or none of figure and image are provided.
+            RuntimeError: If the LLM call or the response parsing fails.
+        """
+        user_prompt = self._build_user_prompt(description, figure, image)
+        try:
+            response = await self.llm.agenerate(
+                user_prompt=user_prompt,
+                system_prompt=self.system_prompt,
+            )
+        except Exception as e:
+            raise RuntimeError(f"Failed to generate response: {e}") from e
+
+        return self._process_response(response, user_prompt)
+
+    def _build_user_prompt(
+        self,
+        description: str,
+        figure: "ekp.Figure | None",
+        image: Image.Image | None,
+    ) -> str:
+        """
+        Validate the evaluation inputs and build the evaluation request prompt.
+
+        Args:
+            description (str): The description to evaluate.
+            figure (Figure | None): Optional figure the description is about.
+            image (Image.Image | None): Optional image the description is about.
+
+        Returns:
+            str: The user prompt of the evaluation request.
+
+        Raises:
+            ValueError: If both or none of figure and image are provided.
+        """
         if figure is not None and image is not None:
             raise ValueError(
                 "Only one of 'figure' or 'image' can be provided, not both.",
             )
         if figure is not None:
-            metadata = self._get_metadata_from_figure(figure)
-            self.user_prompt = self._update_user_prompt_with_metadata(
-                self.user_prompt,
-                metadata,
-            )
-            image = self._get_image_from_figure(figure)
+            self.add_figure_metadata(figure)
+            image = figure_to_image(figure)
         elif image is None and figure is None:
             raise ValueError(
                 "Either 'figure' or 'image' must be provided to generate a description.",
             )
+        return EVALUATION_REQUEST_TEMPLATE.format(
+            user_prompt=self.user_prompt,
+            description=description,
+        )
+
+    def _process_response(
+        self,
+        response: str,
+        user_prompt: str,
+    ) -> CriterionEvaluatorOutput:
+        """
+        Parse the LLM response, discarding it from the LLM if it can't be parsed.
+
+        Args:
+            response (str): The raw LLM response.
+            user_prompt (str): The user prompt of the evaluation request.
+
+        Returns:
+            CriterionEvaluatorOutput: The evaluation result for the criterion.
+
+        Raises:
+            RuntimeError: If the response parsing fails.
+        """
         try:
-            user_prompt = (
-                self.user_prompt
-                + f"\n\n# Description to evaluate\n\n{description}"
-                + "\n\nPlease provide your evaluation of the description against the criteria."
-            )
-            response = self.llm.generate(
+            return self.parse_llm_response(response)
+        except Exception as e:
+            self.llm.discard_response(
                 user_prompt=user_prompt,
                 system_prompt=self.system_prompt,
             )
-            return self.parse_llm_response(response)
-        except Exception as e:
             raise RuntimeError(f"Failed to generate response: {e}") from e
 
     def parse_llm_response(self, response: str) -> CriterionEvaluatorOutput:
@@ -125,27 +214,18 @@ class CriterionEvaluator:
             raise ValueError("Response string is empty or None")
 
         dataclass_fields = fields(CriterionEvaluatorOutput)
+        field_types = {field.name: field.type for field in dataclass_fields}
 
         extracted_values = {}
         parsing_errors = []
 
-        for field in dataclass_fields:
-            field_name = field.name
-            field_type = field.type
-
-            pattern = rf"<{field_name}>(.*?)</{field_name}>"
-
+        for field_name, content in extract_tags(response, _FIELDS_PATTERN).items():
             try:
-                match = re.search(pattern, response, re.DOTALL)
-                if match:
-                    content = match.group(1).strip()
-                    if content:
-                        converted_value = self.convert_to_field_type(
-                            content,
-                            field_name,
-                            field_type,
-                        )
-                        extracted_values[field_name] = converted_value
+                extracted_values[field_name] = self.convert_to_field_type(
+                    content,
+                    field_name,
+                    field_types[field_name],
+                )
             except Exception as e:
                 parsing_errors.append(f"Failed to parse field '{field_name}': {e!s}")
 
@@ -244,7 +324,7 @@ class CriterionEvaluator:
             else:
                 return content
 
-    def _get_metadata_from_figure(self, figure: ekp.Figure) -> FigureMetadata:
+    def _get_metadata_from_figure(self, figure: "ekp.Figure") -> FigureMetadata:
         """
         Extract metadata from the given figure.
 
@@ -302,20 +382,18 @@ class CriterionEvaluator:
 
         return f"{user_prompt}\n\n{metadata_str}"
 
-    def _get_image_from_figure(self, figure: ekp.Figure) -> ImageFile:
+    def add_figure_metadata(self, figure: "ekp.Figure") -> None:
         """
-        Convert the given figure to an image file.
+        Append the metadata extracted from the figure to the user prompt.
 
         Args:
-            figure (ekp.Figure): The figure to convert.
-
-        Returns:
-            ImageFile: The converted image file.
+            figure (ekp.Figure): The figure to extract metadata from.
         """
-        buffer = BytesIO()
-        figure.save(buffer, format="png")
-        buffer.seek(0)
-        return Image.open(buffer)
+        metadata = self._get_metadata_from_figure(figure)
+        self.user_prompt = self._update_user_prompt_with_metadata(
+            self.user_prompt,
+            metadata,
+        )
 
     def append_user_prompt(self, text: str) -> None:
         """Append additional text to the user prompt."""
@@ -337,7 +415,7 @@ class CriterionEvaluatorFactory:
         Returns:
             CriterionEvaluator: CriterionEvaluator instance.
         """
-        if criterion not in ["coherence", "fluency", "consistency", "relevance"]:
+        if criterion not in QualityCriteria:
             raise ValueError(f"Unsupported criterion: {criterion}")
 
         if not llm:
@@ -370,7 +448,7 @@ class EvaluatorAgent:
             RuntimeError: If the evaluator creation fails.
         """
         for criterion in criteria:
-            if criterion not in ["coherence", "fluency", "consistency", "relevance"]:
+            if criterion not in QualityCriteria:
                 raise ValueError(f"Unsupported criterion: {criterion}")
 
         self.criteria = criteria
@@ -388,47 +466,113 @@ class EvaluatorAgent:
     def evaluate(
         self,
         description: str,
-        figure: ekp.Figure | None = None,
-        image: ImageFile | None = None,
+        figure: "ekp.Figure | None" = None,
+        image: Image.Image | None = None,
     ) -> list[CriterionEvaluatorOutput]:
         """
         Evaluate the given text against the specified criteria.
 
+        Criteria are evaluated concurrently in a thread pool.
+
         Args:
             text (str): The text to evaluate.
 
         Returns:
             List[CriterionEvaluatorOutput]: A list of evaluation results for each criterion.
         """
-        if figure is not None and image is not None:
-            raise ValueError(
-                "Only one of 'figure' or 'image' can be provided, not both.",
+        image = self._prepare_image(figure, image)
+
+        def _evaluate(evaluator: CriterionEvaluator) -> CriterionEvaluatorOutput:
+            logger.debug("Evaluating criterion: %s", evaluator.criterion)
+            result = evaluator.evaluate(description=description, image=image)
+            logger.debug(
+                "Criterion evaluation completed",
+                extra={
+                    "criterion": result.name,
+                    "score": result.score,
+                    "max_score": 5,
+                },
             )
+            return result
 
         try:
-            evaluations = []
-            for evaluator in self.evaluators:
-                logger.debug("Evaluating criterion: %s", evaluator.criterion)
-                result = evaluator.evaluate(
-                    description=description,
-                    figure=figure,
-                    image=image,
-                )
-                logger.debug(
-                    "Criterion evaluation completed",
-                    extra={
-                        "criterion": result.name,
-                        "score": result.score,
-                        "max_score": 5,
-                    },
-                )
-                evaluations.append(result)
+            if len(self.evaluators) == 1:
+                evaluations = [_evaluate(self.evaluators[0])]
+            else:
+                with ThreadPoolExecutor(max_workers=len(self.evaluators)) as executor:
+                    evaluations = list(executor.map(_evaluate, self.evaluators))
 
             logger.info("Evaluator successfully evaluated the description")
             return evaluations
         except Exception as e:
             raise RuntimeError(f"Failed to evaluate description: {e}") from e
 
+    async def aevaluate(
+        self,
+        description: str,
+        figure: "ekp.Figure | None" = None,
+        image: Image.Image | None = None,
+    ) -> list[CriterionEvaluatorOutput]:
+        """
+        Asynchronously evaluate the description, requesting all criteria concurrently.
+
+        Args:
+            description (str): The description to evaluate.
+            figure (Figure | None): Optional figure the description is about. Can't be used with image.
+            image (Image.Image | None): Optional image the description is about. Can't be used with figure.
+
+        Returns:
+            List[CriterionEvaluatorOutput]: A list of evaluation results for each criterion.
+        """
+        image = self._prepare_image(figure, image)
+
+        try:
+            evaluations = await asyncio.gather(
+                *(
+                    evaluator.aevaluate(description=description, image=image)
+                    for evaluator in self.evaluators
+                )
+            )
+
+            logger.info("Evaluator successfully evaluated the description")
+            return list(evaluations)
+        except Exception as e:
+            raise RuntimeError(f"Failed to evaluate description: {e}") from e
+
+    def _prepare_image(
+        self,
+        figure: "ekp.Figure | None",
+        image: Image.Image | None,
+    ) -> Image.Image | None:
+        """
+        Render the figure once for all criteria, after adding its metadata to their prompts.
+
+        Args:
+            figure (Figure | None): Optional figure to render. Can't be used with image.
+            image (Image.Image | None): Optional image to use as is. Can't be used with figure.
+
+        Returns:
+            Image.Image | None: The image to evaluate the description against.
+
+        Raises:
+            ValueError: If both figure and image are provided.
+        """
+        if figure is not None and image is not None:
+            raise ValueError(
+                "Only one of 'figure' or 'image' can be provided, not both.",
+            )
+
+        if figure is None:
+            return image
+
+        self.add_figure_metadata(figure)
+        return figure_to_image(figure)
+
+    def add_figure_metadata(self, figure: "ekp.Figure") -> None:
+        """Append the figure metadata to the user prompt of each criterion evaluator."""
+        for evaluator in self.evaluators:
+            evaluator.add_figure_metadata(figure)
+
     def append_user_prompt(self, text: str) -> None:
         """Append additional text to the user prompt of each criterion evaluator."""
         for evaluator in self.evaluators:
@@ -7,16 +7,17 @@ from GRIB files.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import earthkit.data as ekd
+if TYPE_CHECKING:
+    import earthkit.data as ekd
 
 
 class BaseDataExtractor(ABC):
     """Abstract base class for weather data extractors."""
 
     @abstractmethod
-    def validate_data(self, data: ekd.FieldList) -> Any:
+    def validate_data(self, data: "ekd.FieldList") -> Any:
         """
         Parse, validate and return GRIB data.
 
@@ -31,7 +32,7 @@ class BaseDataExtractor(ABC):
         """
 
     @abstractmethod
-    def extract(self, data: ekd.FieldList, **kwargs: Any) -> list[Any]:
+    def extract(self, data: "ekd.FieldList", **kwargs: Any) -> list[Any]:
         """
         Extract features from the input data.
 
@@ -81,14 +81,15 @@ class PressureCenterDataExtractor(BaseDataExtractor):
             ValueError: If required pressure variable not found
         """
         try:
-            available_vars = [str(var) for var in data.metadata("shortName")]
-            if self.pressure_var_name not in available_vars:
+            pressure_fields = data.sel(shortName=self.pressure_var_name)
+            if len(pressure_fields) == 0:
+                available_vars = [str(var) for var in data.metadata("shortName")]
                 raise ValueError(
                     f"Required variable '{self.pressure_var_name}' not found. "
                     f"Available variables: {', '.join(available_vars)}",
                 )
 
-            data_field = data.sel(shortName=self.pressure_var_name)[0]
+            data_field = pressure_fields[0]
             if not isinstance(data_field, ekd.Field):
                 raise ValueError(
                     "Could not extract a valid pressure field from data.",
@@ -125,57 +126,72 @@ class PressureCenterDataExtractor(BaseDataExtractor):
         Returns:
             List[PressureCenter]: List of PressureCenter objects
         """
-        pressure_centers = []
         try:
             data_arr, lats, lons = self.validate_data(data)
-            local_min = data == minimum_filter(data_arr, size=self.neighborhood_size)
-            local_max = data == maximum_filter(data_arr, size=self.neighborhood_size)
-
-            if local_max is None or local_min is None:
-                raise ValueError(
-                    "Could not find local extrema in the data.",
-                )
-
-            min_indices = np.where(local_min)
-            max_indices = np.where(local_max)
-            for i in range(len(min_indices[0])):
-                row, col = min_indices[0][i], min_indices[1][i]
-                pressure_centers.append(
-                    PressureCenter(
-                        center_type="low",
-                        latitude=lats[row, col],
-                        longitude=lons[row, col],
-                        center_value_hPa=data_arr[row, col],
-                        grid_indices=(row, col),
-                    ),
-                )
-            for i in range(len(max_indices[0])):
-                row, col = max_indices[0][i], max_indices[1][i]
-                pressure_centers.append(
-                    PressureCenter(
-                        center_type="high",
-                        latitude=lats[row, col],
-                        longitude=lons[row, col],
-                        center_value_hPa=data_arr[row, col],
-                        grid_indices=(row, col),
-                    ),
-                )
+            local_min = data_arr == minimum_filter(
+                data_arr, size=self.neighborhood_size
+            )
+            local_max = data_arr == maximum_filter(
+                data_arr, size=self.neighborhood_size
+            )
 
-            return pressure_centers
+            return [
+                *self._build_centers("low", local_min, data_arr, lats, lons),
+                *self._build_centers("high", local_max, data_arr, lats, lons),
+            ]
         except Exception as e:
             logger.error("Pressure center data extraction failed: %s", e)
             return []
 
+    @staticmethod
+    def _build_centers(
+        center_type: str,
+        extrema_mask: np.ndarray,
+        data_arr: np.ndarray,
+        lats: np.ndarray,
+        lons: np.ndarray,
+    ) -> list[PressureCenter]:
+        """
+        Build the pressure centers located at the extrema of the pressure field.
+
+        Args:
+            center_type: Type of the centers, "low" or "high"
+            extrema_mask: Boolean mask of the extrema in the pressure field
+            data_arr: Pressure field
+            lats: Latitudes of the pressure field grid points
+            lons: Longitudes of the pressure field grid points
+
+        Returns:
+            List[PressureCenter]: List of PressureCenter objects, one per extremum
+        """
+        indices = np.nonzero(extrema_mask)
+        return [
+            PressureCenter(
+                center_type=center_type,
+                latitude=latitude,
+                longitude=longitude,
+                center_value_hPa=value,
+                grid_indices=grid_indices,
+            )
+            for latitude, longitude, value, grid_indices in zip(
+                lats[indices].tolist(),
+                lons[indices].tolist(),
+                data_arr[indices].tolist(),
+                zip(*(axis.tolist() for axis in indices), strict=True),
+                strict=True,
+            )
+        ]
+
     def format_features_to_str(self, features: list[PressureCenter]) -> str:
         """Format extracted temperature features into a prompt-friendly string."""
 
-        output_str = "## Presure Center Extractor Output\n\n"
+        lines = ["## Presure Center Extractor Output\n"]
         if not features:
-            output_str += "No pressure centers could be extracted.\n"
-            return output_str
+            lines.append("No pressure centers could be extracted.\n")
+            return "\n".join(lines)
 
-        output_str += (
-            "Information extracted about the pressure centers present on the map:\n\n"
+        lines.append(
+            "Information extracted about the pressure centers present on the map:\n"
         )
 
         low_pressure_centers = sorted(
@@ -187,19 +203,18 @@ class PressureCenterDataExtractor(BaseDataExtractor):
             key=lambda x: x.center_value_hPa,
             reverse=True,
         )
-        output_str += "**Low Pressure Centers**:\n"
-        for center in low_pressure_centers:
-            output_str += (
-                f"- {center.center_type.capitalize()} pressure center at "
-                f"({center.latitude:.2f}°N, {center.longitude:.2f}°E) "
-                f"with value {center.center_value_hPa:.2f} hPa.\n"
-            )
-        output_str += "\n**High Pressure Centers**:\n"
-        for center in high_pressure_centers:
-            output_str += (
-                f"- {center.center_type.capitalize()} pressure center at "
-                f"({center.latitude:.2f}°N, {center.longitude:.2f}°E) "
-                f"with value {center.center_value_hPa:.2f} hPa.\n"
-            )
-
-        return output_str
+        lines.append("**Low Pressure Centers**:")
+        lines.extend(self._format_center(center) for center in low_pressure_centers)
+        lines.append("\n**High Pressure Centers**:")
+        lines.extend(self._format_center(center) for center in high_pressure_centers)
+
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _format_center(center: PressureCenter) -> str:
+        """Format a single pressure center into a prompt-friendly line."""
+        return (
+            f"- {center.center_type.capitalize()} pressure center at "
+            f"({center.latitude:.2f}°N, {center.longitude:.2f}°E) "
+            f"with value {center.center_value_hPa:.2f} hPa."
+        )
@@ -5,18 +5,17 @@ This module provides the main structures and classes for generating descriptions
 weather chart images or eathkit-plots figures.
 """
 
-import re
-
 from dataclasses import dataclass, field, fields
-from io import BytesIO
-
-import earthkit.plots as ekp
+from typing import TYPE_CHECKING
 
 from PIL import Image
-from PIL.ImageFile import ImageFile
 
 from earth_reach.config.logging import get_logger
 from earth_reach.core.llm import LLMInterface
+from earth_reach.core.utils import compile_tags_pattern, extract_tags, figure_to_image
+
+if TYPE_CHECKING:
+    import earthkit.plots as ekp
 
 logger = get_logger(__name__)
 
@@ -119,6 +118,9 @@ class GeneratorOutput:
         return len(self.final_description.split())
 
 
+_FIELDS_PATTERN = compile_tags_pattern(field.name for field in fields(GeneratorOutput))
+
+
 class GeneratorAgent:
     """GeneratorAgent class for generating weather charts scientific descriptions."""
 
@@ -142,8 +144,8 @@ class GeneratorAgent:
 
     def generate(
         self,
-        figure: ekp.Figure | None = None,
-        image: ImageFile | None = None,
+        figure: "ekp.Figure | None" = None,
+        image: Image.Image | None = None,
         return_intermediate_steps: bool = False,
     ) -> str | GeneratorOutput:
         """
@@ -151,7 +153,7 @@ class GeneratorAgent:
 
         Args:
             figure (Figure | None): Optional figure to include in the request. Can't be used with image.
-            image (ImageFile | None): Optional image to include in the request (will be converted to base64). Can't be used with figure.
+            image (Image.Image | None): Optional image to include in the request (will be converted to base64). Can't be used with figure.
             return_intermediate_steps (bool): If True, return intermediate steps in the response.
 
         Returns:
@@ -162,53 +164,153 @@ class GeneratorAgent:
             RuntimeError: For other run-time errors.
             Exception: If the LLM response is incomplete or parsing fails.
         """
+        image = self._prepare_image(figure, image)
+
+        try:
+            response = self.llm.generate(
+                user_prompt=self.user_prompt,
+                system_prompt=self.system_prompt,
+                image=image,
+            )
+        except Exception as e:
+            raise RuntimeError(f"Failed to generate response: {e}") from e
+
+        return self._process_response(response, image, return_intermediate_steps)
+
+    async def agenerate(
+        self,
+        figure: "ekp.Figure | None" = None,
+        image: Image.Image | None = None,
+        return_intermediate_steps: bool = False,
+    ) -> str | GeneratorOutput:
+        """
+        Asynchronously generate a structured weather description using the LLM.
+
+        Args:
+            figure (Figure | None): Optional figure to include in the request. Can't be used with image.
+            image (Image.Image | None): Optional image to include in the request (will be converted to base64). Can't be used with figure.
+            return_intermediate_steps (bool): If True, return intermediate steps in the response.
+
+        Returns:
+            str: The final weather description.
+
+        Raises:
+            ValueError: If the output string is empty or None.
+            RuntimeError: For other run-time errors.
+        """
+        image = self._prepare_image(figure, image)
+
+        try:
+            response = await self.llm.agenerate(
+                user_prompt=self.user_prompt,
+                system_prompt=self.system_prompt,
+                image=image,
+            )
+        except Exception as e:
+            raise RuntimeError(f"Failed to generate response: {e}") from e
+
+        return self._process_response(response, image, return_intermediate_steps)
+
+    def _prepare_image(
+        self,
+        figure: "ekp.Figure | None",
+        image: Image.Image | None,
+    ) -> Image.Image:
+        """
+        Validate the request inputs and render the figure if one is provided.
+
+        Args:
+            figure (Figure | None): Optional figure to render.
+            image (Image.Image | None): Optional image to use as is.
+
+        Returns:
+            Image.Image: The image to send to the LLM.
+
+        Raises:
+            ValueError: If both or none of figure and image are provided.
+        """
         if figure is not None and image is not None:
             raise ValueError(
                 "Only one of 'figure' or 'image' can be provided, not both.",
             )
         if figure is not None:
-            metadata = self._get_metadata_from_figure(figure)
-            self.user_prompt = self._update_user_prompt_with_metadata(
-                self.user_prompt,
-                metadata,
-            )
-            image = self._get_image_from_figure(figure)
-        elif image is None and figure is None:
+            self.add_figure_metadata(figure)
+            return figure_to_image(figure, max_side=self.llm.max_image_side)
+        if image is None:
             raise ValueError(
                 "Either 'figure' or 'image' must be provided to generate a description.",
             )
+        return image
+
+    def _process_response(
+        self,
+        response: str,
+        image: Image.Image,
+        return_intermediate_steps: bool,
+    ) -> str | GeneratorOutput:
+        """
+        Parse and validate the LLM response, discarding it from the LLM if it's rejected.
+
+        Args:
+            response (str): The raw LLM response.
+            image (Image.Image): The image sent with the request.
+            return_intermediate_steps (bool): If True, return the parsed output.
 
+        Returns:
+            str | GeneratorOutput: The final description, or the parsed output.
+
+        Raises:
+            RuntimeError: If the parsed output is incomplete or the description is empty.
+        """
         try:
-            response = self.llm.generate(
+            return self._validate_response(response, return_intermediate_steps)
+        except Exception as e:
+            self.llm.discard_response(
                 user_prompt=self.user_prompt,
                 system_prompt=self.system_prompt,
                 image=image,
             )
+            raise RuntimeError(f"Failed to generate response: {e}") from e
 
-            logger.debug("Parsing LLM response for structured output")
-            parsed_output = self.parse_llm_response(response)
-            if not parsed_output.is_complete():
-                logger.warning(
-                    "LLM response parsing incomplete",
-                    extra={
-                        "missing_fields": parsed_output.get_missing_fields(),
-                        "total_fields": len(list(fields(parsed_output))),
-                    },
-                )
-                raise ValueError(
-                    "Parsed output is incomplete. Missing fields: "
-                    f"{parsed_output.get_missing_fields()}",
-                )
+    def _validate_response(
+        self,
+        response: str,
+        return_intermediate_steps: bool,
+    ) -> str | GeneratorOutput:
+        """
+        Parse and validate the LLM response.
 
-            if return_intermediate_steps:
-                return parsed_output
+        Args:
+            response (str): The raw LLM response.
+            return_intermediate_steps (bool): If True, return the parsed output.
 
-            description = parsed_output.final_description
-            if not description or not description.strip():
-                raise ValueError("Final description is empty or None.")
+        Returns:
+            str | GeneratorOutput: The final description, or the parsed output.
 
-        except Exception as e:
-            raise RuntimeError(f"Failed to generate response: {e}") from e
+        Raises:
+            ValueError: If the parsed output is incomplete or the description is empty.
+        """
+        logger.debug("Parsing LLM response for structured output")
+        parsed_output = self.parse_llm_response(response)
+        if not parsed_output.is_complete():
+            logger.warning(
+                "LLM response parsing incomplete",
+                extra={
+                    "missing_fields": parsed_output.get_missing_fields(),
+                    "total_fields": len(list(fields(parsed_output))),
+                },
+            )
+            raise ValueError(
+                "Parsed output is incomplete. Missing fields: "
+                f"{parsed_output.get_missing_fields()}",
+            )
+
+        if return_intermediate_steps:
+            return parsed_output
+
+        description = parsed_output.final_description
+        if not description or not description.strip():
+            raise ValueError("Final description is empty or None.")
 
         logger.info("Generator successfully generated a description")
         return description
@@ -225,32 +327,13 @@ class GeneratorAgent:
 
         Raises:
             ValueError: If the response string is empty or None
-            Exception: If parsing fails for any step
         """
         if not response or not response.strip():
             raise ValueError("Response string is empty or None")
 
-        result = GeneratorOutput()
-
-        patterns = {
-            field.name: rf"<{field.name}>(.*?)</{field.name}>"
-            for field in fields(GeneratorOutput)
-        }
-
-        for field_name, pattern in patterns.items():
-            try:
-                match = re.search(pattern, response, re.DOTALL)
-                if match:
-                    content = match.group(1).strip()
-                    if content:
-                        setattr(result, field_name, content)
-            except Exception as e:
-                print(f"Warning: Failed to parse {field_name}: {e}")
-                continue
+        return GeneratorOutput(**extract_tags(response, _FIELDS_PATTERN))
 
-        return result
-
-    def _get_metadata_from_figure(self, figure: ekp.Figure) -> FigureMetadata:
+    def _get_metadata_from_figure(self, figure: "ekp.Figure") -> FigureMetadata:
         """
         Extract metadata from the given figure.
 
@@ -319,20 +402,18 @@ class GeneratorAgent:
 
         return f"{user_prompt}\n\n{metadata_str}"
 
-    def _get_image_from_figure(self, figure: ekp.Figure) -> ImageFile:
+    def add_figure_metadata(self, figure: "ekp.Figure") -> None:
         """
-        Convert the given figure to an image file.
+        Append the metadata extracted from the figure to the user prompt.
 
         Args:
-            figure (ekp.Figure): The figure to convert.
-
-        Returns:
-            ImageFile: The converted image file.
+            figure (ekp.Figure): The figure to extract metadata from.
         """
-        buffer = BytesIO()
-        figure.save(buffer, format="png")
-        buffer.seek(0)
-        return Image.open(buffer)
+        metadata = self._get_metadata_from_figure(figure)
+        self.user_prompt = self._update_user_prompt_with_metadata(
+            self.user_prompt,
+            metadata,
+        )
 
     def append_user_prompt(self, text: str) -> None:
         """Append additional text to the user prompt."""
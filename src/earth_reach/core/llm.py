@@ -5,26 +5,75 @@ Provides an abstract interface and concrete implementations for various
 Large Language Model providers including OpenAI, Google Gemini, and Anthropic Claude.
 """
 
+import asyncio
+import contextlib
+import contextvars
+import hashlib
+import importlib.util
 import os
+import threading
 
 from abc import ABC, abstractmethod
-from typing import Any
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from io import BytesIO
+from typing import TYPE_CHECKING, Any
 
-import openai
-
-from google import genai
-from google.genai import types
-from PIL.ImageFile import ImageFile
+from PIL import Image
 
 from earth_reach.config.logging import get_logger
-from earth_reach.core.utils import img_to_base64, img_to_bytes
+from earth_reach.core.utils import (
+    MAX_IMAGE_SIDE,
+    downscale_image,
+    encode_image,
+    image_digest,
+    img_to_base64,
+)
+
+if TYPE_CHECKING:
+    import httpx
+    import openai
+
+    from google import genai
+    from google.genai import types
 
 logger = get_logger(__name__)
 
+MAX_HTTP_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 32
+DEFAULT_REQUEST_TIMEOUT_SECONDS = 600.0
+CONNECT_TIMEOUT_SECONDS = 10.0
+MAX_RETRIES = 5
+UPLOADED_FILES_CACHE_SIZE = 256
+PROMPT_CACHE_KEY_PREFIX_CHARS = 4096
+
+_openai_clients: dict[tuple[str, str | None], "openai.OpenAI"] = {}
+_openai_clients_lock = threading.Lock()
+_genai_clients: dict[str, "genai.Client"] = {}
+_genai_clients_lock = threading.Lock()
+_async_openai_clients: contextvars.ContextVar[
+    dict[tuple[str, str | None], "openai.AsyncOpenAI"] | None
+] = contextvars.ContextVar("_async_openai_clients", default=None)
+_async_genai_clients: contextvars.ContextVar[
+    dict[str, "genai.Client"] | None
+] = contextvars.ContextVar("_async_genai_clients", default=None)
+
+
+@dataclass
+class LLMRequest:
+    """A single generation request, as consumed by LLMInterface.agenerate_batch."""
+
+    user_prompt: str
+    system_prompt: str | None = None
+    image: Image.Image | None = None
+
 
 class LLMInterface(ABC):
     """Abstract base class defining the interface for all LLM provider implementations."""
 
+    max_image_side: int = MAX_IMAGE_SIDE
+
     @property
     @abstractmethod
     def provider_name(self) -> str:
@@ -35,7 +84,7 @@ class LLMInterface(ABC):
         self,
         user_prompt: str,
         system_prompt: str | None = None,
-        image: ImageFile | None = None,
+        image: Image.Image | None = None,
     ) -> str:
         """
         Generate a response from the LLM based on the user prompt and optional system prompt.
@@ -53,6 +102,271 @@ class LLMInterface(ABC):
             RuntimeError: For other run-time errors.
         """
 
+    async def agenerate(
+        self,
+        user_prompt: str,
+        system_prompt: str | None = None,
+        image: Image.Image | None = None,
+    ) -> str:
+        """
+        Asynchronously generate a response from the LLM.
+
+        The default implementation runs the blocking generate method in a worker thread,
+        providers with a native asynchronous client can override it.
+
+        Args:
+            user_prompt (str): The prompt provided by the user to define the task.
+            system_prompt (str | None): An optional system prompt to guide the model's response.
+            image: Optional image to include in the request.
+
+        Returns:
+            str: The generated response content from the LLM.
+
+        Raises:
+            ValueError: If user_prompt is empty/None or if the API response is empty.
+            RuntimeError: For other run-time errors.
+        """
+        return await asyncio.to_thread(
+            self.generate,
+            user_prompt=user_prompt,
+            system_prompt=system_prompt,
+            image=image,
+        )
+
+    async def agenerate_batch(
+        self,
+        requests: list[LLMRequest],
+        max_concurrency: int = 8,
+    ) -> list[str]:
+        """
+        Generate responses for several requests concurrently.
+
+        Args:
+            requests (list[LLMRequest]): The requests to send to the LLM.
+            max_concurrency (int): Maximum number of requests in flight at once.
+
+        Returns:
+            list[str]: The generated responses, in the same order as the requests.
+
+        Raises:
+            ValueError: If max_concurrency is not positive, or if a request is invalid.
+            RuntimeError: If an API call fails.
+        """
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be greater than 0")
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _generate(request: LLMRequest) -> str:
+            async with semaphore:
+                return await self.agenerate(
+                    user_prompt=request.user_prompt,
+                    system_prompt=request.system_prompt,
+                    image=request.image,
+                )
+
+        async with async_client_scope():
+            return list(await asyncio.gather(*(_generate(r) for r in requests)))
+
+    def discard_response(
+        self,
+        user_prompt: str,
+        system_prompt: str | None = None,
+        image: Image.Image | None = None,
+    ) -> None:
+        """
+        Discard the response to a request, after the caller rejected it.
+
+        LLMs that keep previous responses must not return a rejected one again. Others
+        have nothing to discard.
+
+        Args:
+            user_prompt (str): The prompt provided by the user to define the task.
+            system_prompt (str | None): An optional system prompt to guide the model's response.
+            image: Optional image included in the request.
+        """
+        return None
+
+    def _log_api_failure(self) -> None:
+        """Log a failed LLM API call with the current exception."""
+        logger.error(
+            "LLM API call failed",
+            extra={
+                "provider": self.provider_name,
+                "model": getattr(self, "model_name", None),
+            },
+            exc_info=True,
+        )
+
+
+def _get_request_timeout_seconds() -> float:
+    """
+    Get the timeout of LLM API requests, in seconds.
+
+    Responses aren't streamed, so the timeout must cover the whole generation, which
+    can take several minutes for reasoning models and long prompts.
+
+    Returns:
+        float: The LLM_REQUEST_TIMEOUT environment variable if set, or the OpenAI SDK
+            default of 10 minutes otherwise.
+    """
+    return float(os.getenv("LLM_REQUEST_TIMEOUT", DEFAULT_REQUEST_TIMEOUT_SECONDS))
+
+
+def _get_request_timeout() -> "httpx.Timeout":
+    """
+    Get the timeout applied to LLM API requests.
+
+    An unreachable endpoint fails fast on the connect timeout, while generations keep
+    the full request timeout.
+
+    Returns:
+        httpx.Timeout: The request timeout.
+    """
+    import httpx
+
+    return httpx.Timeout(
+        _get_request_timeout_seconds(), connect=CONNECT_TIMEOUT_SECONDS
+    )
+
+
+def _get_http_limits() -> "httpx.Limits":
+    """
+    Get the connection pool limits of the shared LLM API clients.
+
+    Returns:
+        httpx.Limits: The connection pool limits.
+    """
+    import httpx
+
+    return httpx.Limits(
+        max_connections=MAX_HTTP_CONNECTIONS,
+        max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+    )
+
+
+def _get_openai_client(base_url: str, api_key: str | None) -> "openai.OpenAI":
+    """
+    Get the shared OpenAI client for the given endpoint and API key.
+
+    Clients are created once per (base_url, api_key) pair and reused by all LLM
+    instances. HTTP/2 is enabled when the optional h2 package is installed.
+
+    Args:
+        base_url (str): The base URL for the LLM API.
+        api_key (str | None): The API key for authentication with the LLM provider.
+
+    Returns:
+        openai.OpenAI: The shared client.
+    """
+    key = (base_url, api_key)
+    with _openai_clients_lock:
+        client = _openai_clients.get(key)
+        if client is None:
+            import openai
+
+            client = openai.OpenAI(
+                base_url=base_url,
+                api_key=api_key,
+                timeout=_get_request_timeout(),
+                max_retries=MAX_RETRIES,
+                http_client=openai.DefaultHttpxClient(
+                    http2=importlib.util.find_spec("h2") is not None,
+                    limits=_get_http_limits(),
+                ),
+            )
+            _openai_clients[key] = client
+        return client
+
+
+def _create_async_openai_client(
+    base_url: str, api_key: str | None
+) -> "openai.AsyncOpenAI":
+    """
+    Create an async OpenAI client for the given endpoint and API key.
+
+    Args:
+        base_url (str): The base URL for the LLM API.
+        api_key (str | None): The API key for authentication with the LLM provider.
+
+    Returns:
+        openai.AsyncOpenAI: The new async client, to be closed by the caller.
+    """
+    import openai
+
+    return openai.AsyncOpenAI(
+        base_url=base_url,
+        api_key=api_key,
+        timeout=_get_request_timeout(),
+        max_retries=MAX_RETRIES,
+        http_client=openai.DefaultAsyncHttpxClient(
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=_get_http_limits(),
+        ),
+    )
+
+
+@contextlib.asynccontextmanager
+async def async_client_scope() -> AsyncIterator[None]:
+    """
+    Share async LLM API clients between the calls made within the block.
+
+    Within the scope, all LLM instances targeting the same endpoint share one client.
+    The clients are closed when the scope exits. Nested scopes reuse the clients of
+    the outermost one.
+
+    Yields:
+        None
+    """
+    if _async_openai_clients.get() is not None:
+        yield
+        return
+
+    openai_clients: dict[tuple[str, str | None], openai.AsyncOpenAI] = {}
+    genai_clients: dict[str, genai.Client] = {}
+    openai_token = _async_openai_clients.set(openai_clients)
+    genai_token = _async_genai_clients.set(genai_clients)
+    try:
+        yield
+    finally:
+        _async_genai_clients.reset(genai_token)
+        _async_openai_clients.reset(openai_token)
+        for client in openai_clients.values():
+            await client.close()
+        for genai_client in genai_clients.values():
+            await _close_async_genai_client(genai_client)
+
+
+@contextlib.asynccontextmanager
+async def _get_async_openai_client(
+    base_url: str, api_key: str | None
+) -> AsyncIterator["openai.AsyncOpenAI"]:
+    """
+    Get an async OpenAI client for the given endpoint and API key.
+
+    Within an async_client_scope, the client of the scope is reused. Otherwise, a
+    client is created for the call and closed afterwards.
+
+    Args:
+        base_url (str): The base URL for the LLM API.
+        api_key (str | None): The API key for authentication with the LLM provider.
+
+    Yields:
+        openai.AsyncOpenAI: The async client.
+    """
+    clients = _async_openai_clients.get()
+    if clients is None:
+        async with _create_async_openai_client(base_url, api_key) as client:
+            yield client
+        return
+
+    key = (base_url, api_key)
+    client = clients.get(key)
+    if client is None:
+        client = _create_async_openai_client(base_url, api_key)
+        clients[key] = client
+    yield client
+
 
 class OpenAICompatibleLLM(LLMInterface):
     """Base class for OpenAI-compatible LLM implementations (Groq, OpenAI, etc.)."""
@@ -62,6 +376,7 @@ class OpenAICompatibleLLM(LLMInterface):
         model_name: str,
         base_url: str,
         api_key: str | None = None,
+        max_image_side: int = MAX_IMAGE_SIDE,
     ) -> None:
         """
         Initialize the LLM with a model name and optional keyword arguments.
@@ -70,16 +385,15 @@ class OpenAICompatibleLLM(LLMInterface):
             model_name (str): The name of the model to use.
             base_url (str): The base URL for the LLM API.
             api_key (str | None): The API key for authentication with the LLM provider.
-            **kwargs: Additional keyword arguments for the LLM configuration.
+            max_image_side (int): Maximum width and height, in pixels, of the images sent
+                to the model. Larger images are downscaled before encoding.
         """
         self.model_name = model_name
         self.base_url = base_url
         self.api_key = api_key
+        self.max_image_side = max_image_side
 
-        self.client = openai.OpenAI(
-            base_url=base_url,
-            api_key=api_key,
-        )
+        self.client = _get_openai_client(base_url, api_key)
 
     @property
     def provider_name(self):
@@ -89,7 +403,7 @@ class OpenAICompatibleLLM(LLMInterface):
         self,
         user_prompt: str,
         system_prompt: str | None = None,
-        image: ImageFile | None = None,
+        image: Image.Image | None = None,
     ) -> str:
         """
         Generate a response from the LLM API based on the user prompt and optional system prompt.
@@ -97,7 +411,44 @@ class OpenAICompatibleLLM(LLMInterface):
         Args:
             user_prompt (str): The prompt provided by the user to define the task.
             system_prompt (str | None): An optional system prompt to guide the model's response.
-            image: Optional image to include in the request (will be converted to base64).
+            image: Optional image to include in the request (will be downscaled and sent as base64 JPEG).
+
+        Returns:
+            str: The generated response content from the LLM.
+
+        Raises:
+            ValueError: If user_prompt is empty/None or if the API response is empty.
+            RuntimeError: For other run-time errors.
+        """
+        messages = self._build_messages(user_prompt, system_prompt, image)
+
+        try:
+            response = self.client.chat.completions.create(
+                model=self.model_name,
+                messages=messages,
+                extra_body=self._get_extra_body(messages),
+            )
+            return self._get_response_content(response, user_prompt, image)
+
+        except ValueError:
+            raise
+        except Exception as e:
+            self._log_api_failure()
+            raise RuntimeError("LLM API call failed") from e
+
+    async def agenerate(
+        self,
+        user_prompt: str,
+        system_prompt: str | None = None,
+        image: Image.Image | None = None,
+    ) -> str:
+        """
+        Asynchronously generate a response from the LLM API using the native async client.
+
+        Args:
+            user_prompt (str): The prompt provided by the user to define the task.
+            system_prompt (str | None): An optional system prompt to guide the model's response.
+            image: Optional image to include in the request (will be downscaled and sent as base64 JPEG).
 
         Returns:
             str: The generated response content from the LLM.
@@ -106,7 +457,58 @@ class OpenAICompatibleLLM(LLMInterface):
             ValueError: If user_prompt is empty/None or if the API response is empty.
             RuntimeError: For other run-time errors.
         """
+        # Encoding the image is CPU-bound, so it runs in a worker thread
+        messages = await asyncio.to_thread(
+            self._build_messages, user_prompt, system_prompt, image
+        )
 
+        try:
+            async with _get_async_openai_client(self.base_url, self.api_key) as client:
+                response = await client.chat.completions.create(
+                    model=self.model_name,
+                    messages=messages,
+                    extra_body=self._get_extra_body(messages),
+                )
+            return self._get_response_content(response, user_prompt, image)
+
+        except ValueError:
+            raise
+        except Exception as e:
+            self._log_api_failure()
+            raise RuntimeError("LLM API call failed") from e
+
+    def _get_extra_body(self, messages: list[Any]) -> dict[str, Any] | None:
+        """
+        Get provider-specific fields to add to the request body.
+
+        Args:
+            messages (list[Any]): The chat messages of the request.
+
+        Returns:
+            dict[str, Any] | None: Extra request body fields, or None if there are none.
+        """
+        return None
+
+    def _build_messages(
+        self,
+        user_prompt: str,
+        system_prompt: str | None,
+        image: Image.Image | None,
+    ) -> list[Any]:
+        """
+        Build the chat messages sent to the LLM API.
+
+        Args:
+            user_prompt (str): The prompt provided by the user to define the task.
+            system_prompt (str | None): An optional system prompt to guide the model's response.
+            image: Optional image to include in the request.
+
+        Returns:
+            list[Any]: The chat messages.
+
+        Raises:
+            ValueError: If user_prompt is empty/None or if the image can't be processed.
+        """
         if not user_prompt or not user_prompt.strip():
             raise ValueError("user_prompt cannot be empty or None")
 
@@ -117,7 +519,10 @@ class OpenAICompatibleLLM(LLMInterface):
 
         try:
             if image:
-                base64_image = img_to_base64(img=image)
+                base64_image = img_to_base64(
+                    img=downscale_image(image, self.max_image_side),
+                    image_format="JPEG",
+                )
                 if not base64_image:
                     raise ValueError("Failed to convert image to base64")
 
@@ -138,44 +543,45 @@ class OpenAICompatibleLLM(LLMInterface):
         except Exception as e:
             raise ValueError(f"Failed to process input data: {e}") from e
 
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model_name,
-                messages=messages,
-            )
+        return messages
 
-            content = response.choices[0].message.content
+    def _get_response_content(
+        self,
+        response: Any,
+        user_prompt: str,
+        image: Image.Image | None,
+    ) -> str:
+        """
+        Extract and validate the generated content from a chat completion response.
 
-            if not content or not isinstance(content, str) or not content.strip():
-                raise ValueError(
-                    "The generated response content is empty or not a string"
-                )
+        Args:
+            response: The chat completion response.
+            user_prompt (str): The prompt sent to the LLM, for logging.
+            image: The image sent to the LLM, if any, for logging.
 
-            logger.info(
-                "LLM API call completed successfully",
-                extra={
-                    "provider": self.provider_name,
-                    "model": self.model_name,
-                    "input_length": len(user_prompt),
-                    "output_length": len(content),
-                    "has_image": image is not None,
-                },
-            )
+        Returns:
+            str: The stripped generated content.
 
-            return content.strip()
+        Raises:
+            ValueError: If the generated content is empty or not a string.
+        """
+        content = response.choices[0].message.content
+
+        if not content or not isinstance(content, str) or not content.strip():
+            raise ValueError("The generated response content is empty or not a string")
+
+        logger.info(
+            "LLM API call completed successfully",
+            extra={
+                "provider": self.provider_name,
+                "model": self.model_name,
+                "input_length": len(user_prompt),
+                "output_length": len(content),
+                "has_image": image is not None,
+            },
+        )
 
-        except ValueError:
-            raise
-        except Exception as e:
-            logger.error(
-                "LLM API call failed",
-                extra={
-                    "provider": self.provider_name,
-                    "model": self.model_name,
-                },
-                exc_info=True,
-            )
-            raise RuntimeError("LLM API call failed") from e
+        return content.strip()
 
     def __repr__(self) -> str:
         return f"LLM(model_name={self.model_name}, base_url={self.base_url})"
@@ -184,12 +590,19 @@ class OpenAICompatibleLLM(LLMInterface):
 class GroqLLM(OpenAICompatibleLLM):
     """Implementation of the LLMInterface for Groq LLM API Provider."""
 
-    def __init__(self, model_name: str, api_key: str | None = None) -> None:
+    def __init__(
+        self,
+        model_name: str,
+        api_key: str | None = None,
+        max_image_side: int = MAX_IMAGE_SIDE,
+    ) -> None:
         """Initialize the Groq LLM with a model name and optional API key.
 
         Args:
             model_name (str): The name of the Groq model to use.
             api_key (str | None): The API key for authentication with the Groq API.
+            max_image_side (int): Maximum width and height, in pixels, of the images sent
+                to the model.
 
         Raises:
             AssertionError: If the API key is not provided and not found in environment variables.
@@ -208,6 +621,7 @@ class GroqLLM(OpenAICompatibleLLM):
             model_name=model_name,
             api_key=api_key,
             base_url="https://api.groq.com/openai/v1",
+            max_image_side=max_image_side,
         )
 
     @property
@@ -218,12 +632,19 @@ class GroqLLM(OpenAICompatibleLLM):
 class OpenAILLM(OpenAICompatibleLLM):
     """Implementation of the LLMInterface for OpenAI API Provider."""
 
-    def __init__(self, model_name: str, api_key: str | None = None) -> None:
+    def __init__(
+        self,
+        model_name: str,
+        api_key: str | None = None,
+        max_image_side: int = MAX_IMAGE_SIDE,
+    ) -> None:
         """Initialize the OpenAI LLM with a model name and optional API key.
 
         Args:
             model_name (str): The name of the OpenAI model to use.
             api_key (str | None): The API key for authentication with the OpenAI API.
+            max_image_side (int): Maximum width and height, in pixels, of the images sent
+                to the model.
 
         Raises:
             AssertionError: If the API key is not provided and not found in environment variables.
@@ -242,22 +663,145 @@ class OpenAILLM(OpenAICompatibleLLM):
             model_name=model_name,
             api_key=api_key,
             base_url="https://api.openai.com/v1",
+            max_image_side=max_image_side,
         )
 
     @property
     def provider_name(self):
         return "openAI"
 
+    def _get_extra_body(self, messages: list[Any]) -> dict[str, Any] | None:
+        """
+        Add a prompt cache key derived from the start of the prompt.
+
+        Requests sharing the same instructions get the same key, which lets the OpenAI
+        API route them to the same prompt cache even as the end of the prompt varies.
+
+        Args:
+            messages (list[Any]): The chat messages of the request.
+
+        Returns:
+            dict[str, Any] | None: The prompt_cache_key field.
+        """
+        content = messages[0]["content"]
+        if isinstance(content, list):
+            content = content[0]["text"]
+
+        prefix = content[:PROMPT_CACHE_KEY_PREFIX_CHARS]
+        return {"prompt_cache_key": hashlib.sha256(prefix.encode()).hexdigest()}
+
+
+def _create_genai_client(api_key: str) -> "genai.Client":
+    """
+    Create a Gemini client for the given API key.
+
+    Args:
+        api_key (str): The API key for authentication with the Gemini API.
+
+    Returns:
+        genai.Client: The new client.
+    """
+    from google import genai
+    from google.genai import types
+
+    return genai.Client(
+        api_key=api_key,
+        http_options=types.HttpOptions(
+            timeout=int(_get_request_timeout_seconds() * 1000),
+            # Back off exponentially, with jitter, on rate limits and server errors
+            retry_options=types.HttpRetryOptions(attempts=MAX_RETRIES + 1),
+        ),
+    )
+
+
+def _get_genai_client(api_key: str) -> "genai.Client":
+    """
+    Get the shared Gemini client for the given API key.
+
+    Clients are created once per API key and reused by all Gemini LLM instances for
+    blocking calls. Async calls go through _get_async_genai_client instead, as the
+    connection pool of the async client is bound to the event loop that opened it.
+
+    Args:
+        api_key (str): The API key for authentication with the Gemini API.
+
+    Returns:
+        genai.Client: The shared client.
+    """
+    with _genai_clients_lock:
+        client = _genai_clients.get(api_key)
+        if client is None:
+            client = _create_genai_client(api_key)
+            _genai_clients[api_key] = client
+        return client
+
+
+async def _close_async_genai_client(client: "genai.Client") -> None:
+    """
+    Close the async connection pool of a Gemini client.
+
+    Args:
+        client (genai.Client): The client to close.
+    """
+    # AsyncClient.aclose is missing from older google-genai releases, in which case
+    # the pool is released when the client is garbage collected
+    aclose = getattr(client.aio, "aclose", None)
+    if aclose is not None:
+        await aclose()
+
+
+@contextlib.asynccontextmanager
+async def _get_async_genai_client(
+    api_key: str,
+) -> AsyncIterator["genai.client.AsyncClient"]:
+    """
+    Get an async Gemini client for the given API key.
+
+    Within an async_client_scope, the client of the scope is reused. Otherwise, a
+    client is created for the call and closed afterwards.
+
+    Args:
+        api_key (str): The API key for authentication with the Gemini API.
+
+    Yields:
+        genai.client.AsyncClient: The async client.
+    """
+    clients = _async_genai_clients.get()
+    if clients is None:
+        client = _create_genai_client(api_key)
+        try:
+            yield client.aio
+        finally:
+            await _close_async_genai_client(client)
+        return
+
+    client = clients.get(api_key)
+    if client is None:
+        client = _create_genai_client(api_key)
+        clients[api_key] = client
+    yield client.aio
+
 
 class GeminiLLM(LLMInterface):
     """Implementation of the LLMInterface for Google Gemini API Provider."""
 
-    def __init__(self, model_name: str, api_key: str | None = None) -> None:
+    def __init__(
+        self,
+        model_name: str,
+        api_key: str | None = None,
+        upload_images: bool = False,
+        max_image_side: int = MAX_IMAGE_SIDE,
+    ) -> None:
         """Initialize the Gemini LLM with a model name and optional API key.
 
         Args:
             model_name (str): The name of the Gemini model to use.
             api_key (str | None): The API key for authentication with the Gemini API.
+            upload_images (bool): If True, upload images once through the Gemini Files API
+                and reference them by URI in subsequent requests, instead of inlining
+                the image bytes in every request.
+            max_image_side (int): Maximum width and height, in pixels, of the images sent
+                to the model.
 
         Raises:
             AssertionError: If the API key is not provided and not found in environment variables.
@@ -272,7 +816,12 @@ class GeminiLLM(LLMInterface):
 
         self.model_name = model_name
         self.api_key = api_key
-        self.client = genai.Client(api_key=api_key)
+        self.upload_images = upload_images
+        self.max_image_side = max_image_side
+
+        self.client = _get_genai_client(api_key)
+        self._uploaded_files: OrderedDict[str, types.File] = OrderedDict()
+        self._uploaded_files_lock = threading.Lock()
 
     @property
     def provider_name(self):
@@ -282,7 +831,7 @@ class GeminiLLM(LLMInterface):
         self,
         user_prompt: str,
         system_prompt: str | None = None,
-        image: ImageFile | None = None,
+        image: Image.Image | None = None,
     ) -> str:
         """
         Generate a response from the Gemini API based on the user prompt and optional system prompt.
@@ -290,7 +839,45 @@ class GeminiLLM(LLMInterface):
         Args:
             user_prompt (str): The prompt provided by the user to define the task.
             system_prompt (str | None): An optional system prompt to guide the model's response.
-            image: Optional image to include in the request (ImageFile).
+            image: Optional image to include in the request (will be downscaled and sent as JPEG).
+
+        Returns:
+            str: The generated response content from the Gemini API.
+
+        Raises:
+            ValueError: If user_prompt is empty/None or if the API response is empty.
+            RuntimeError: For other run-time errors.
+        """
+
+        contents, config = self._build_request(user_prompt, system_prompt, image)
+
+        try:
+            response = self.client.models.generate_content(
+                model=self.model_name,
+                contents=contents,
+                config=config,
+            )
+            return self._get_response_text(response, user_prompt, image)
+
+        except ValueError:
+            raise
+        except Exception as e:
+            self._log_api_failure()
+            raise RuntimeError("LLM API call failed") from e
+
+    async def agenerate(
+        self,
+        user_prompt: str,
+        system_prompt: str | None = None,
+        image: Image.Image | None = None,
+    ) -> str:
+        """
+        Asynchronously generate a response from the Gemini API using the native async client.
+
+        Args:
+            user_prompt (str): The prompt provided by the user to define the task.
+            system_prompt (str | None): An optional system prompt to guide the model's response.
+            image: Optional image to include in the request (will be downscaled and sent as JPEG).
 
         Returns:
             str: The generated response content from the Gemini API.
@@ -299,70 +886,162 @@ class GeminiLLM(LLMInterface):
             ValueError: If user_prompt is empty/None or if the API response is empty.
             RuntimeError: For other run-time errors.
         """
+        if self.upload_images:
+            # Uploading goes through the blocking Files API client
+            contents, config = await asyncio.to_thread(
+                self._build_request, user_prompt, system_prompt, image
+            )
+        else:
+            contents, config = self._build_request(user_prompt, system_prompt, image)
+
+        try:
+            async with _get_async_genai_client(self.api_key) as client:
+                response = await client.models.generate_content(
+                    model=self.model_name,
+                    contents=contents,
+                    config=config,
+                )
+            return self._get_response_text(response, user_prompt, image)
+
+        except ValueError:
+            raise
+        except Exception as e:
+            self._log_api_failure()
+            raise RuntimeError("LLM API call failed") from e
+
+    def _build_request(
+        self,
+        user_prompt: str,
+        system_prompt: str | None,
+        image: Image.Image | None,
+    ) -> tuple[list[Any], "types.GenerateContentConfig | None"]:
+        """
+        Build the contents and configuration of a Gemini API request.
+
+        Args:
+            user_prompt (str): The prompt provided by the user to define the task.
+            system_prompt (str | None): An optional system prompt to guide the model's response.
+            image: Optional image to include in the request.
+
+        Returns:
+            tuple[list[Any], types.GenerateContentConfig | None]: The request contents
+                and the optional request configuration.
 
+        Raises:
+            ValueError: If user_prompt is empty/None or if the image can't be processed.
+        """
         if not user_prompt or not user_prompt.strip():
             raise ValueError("user_prompt cannot be empty or None")
 
         try:
-            full_prompt = user_prompt.strip()
+            from google.genai import types
+
+            config = None
             if system_prompt and system_prompt.strip():
-                full_prompt = f"{system_prompt.strip()}\n\n{user_prompt.strip()}"
+                config = types.GenerateContentConfig(
+                    system_instruction=system_prompt.strip(),
+                )
 
             contents: list[Any] = []
             if image:
-                image_bytes = img_to_bytes(image)
-                if not image_bytes:
-                    raise ValueError("Failed to convert image to bytes")
-
                 contents.append(
-                    types.Part.from_bytes(
-                        data=image_bytes,
-                        mime_type="image/png",
-                    ),
+                    self._get_image_part(downscale_image(image, self.max_image_side))
                 )
-            contents.append(full_prompt)
+            contents.append(user_prompt.strip())
 
         except Exception as e:
             raise ValueError(f"Failed to process input data: {e}") from e
 
-        try:
-            response = self.client.models.generate_content(
-                model=self.model_name,
-                contents=contents,
-            )
+        return contents, config
 
-            content = response.text
+    def _get_response_text(
+        self,
+        response: Any,
+        user_prompt: str,
+        image: Image.Image | None,
+    ) -> str:
+        """
+        Extract and validate the generated text from a Gemini API response.
 
-            if not content or not isinstance(content, str) or not content.strip():
-                raise ValueError(
-                    "The generated response content is empty or not a string"
-                )
+        Args:
+            response: The Gemini API response.
+            user_prompt (str): The prompt sent to the LLM, for logging.
+            image: The image sent to the LLM, if any, for logging.
 
-            logger.info(
-                "LLM API call completed successfully",
-                extra={
-                    "provider": self.provider_name,
-                    "model": self.model_name,
-                    "input_length": len(user_prompt),
-                    "output_length": len(content),
-                    "has_image": image is not None,
-                },
-            )
+        Returns:
+            str: The stripped generated text.
 
-            return content.strip()
+        Raises:
+            ValueError: If the generated text is empty or not a string.
+        """
+        content = response.text
+
+        if not content or not isinstance(content, str) or not content.strip():
+            raise ValueError("The generated response content is empty or not a string")
+
+        logger.info(
+            "LLM API call completed successfully",
+            extra={
+                "provider": self.provider_name,
+                "model": self.model_name,
+                "input_length": len(user_prompt),
+                "output_length": len(content),
+                "has_image": image is not None,
+            },
+        )
 
-        except ValueError:
-            raise
-        except Exception as e:
-            logger.error(
-                "LLM API call failed",
-                extra={
-                    "provider": self.provider_name,
-                    "model": self.model_name,
-                },
-                exc_info=True,
+        return content.strip()
+
+    def _get_image_part(self, image: Image.Image) -> "types.Part":
+        """
+        Build the request part holding the image.
+
+        The image is sent as JPEG. When image uploads are enabled, each distinct image
+        is uploaded once and referenced by URI afterwards. Uploaded files are kept in an
+        LRU of UPLOADED_FILES_CACHE_SIZE entries, keyed by the image content digest.
+
+        Args:
+            image (Image.Image): The image to include in the request.
+
+        Returns:
+            types.Part: The request part referencing or inlining the image.
+
+        Raises:
+            ValueError: If the image can't be converted or uploaded.
+        """
+        from google.genai import types
+
+        digest = image_digest(image)
+        with self._uploaded_files_lock:
+            uploaded_file = self._uploaded_files.get(digest)
+            if uploaded_file is not None:
+                self._uploaded_files.move_to_end(digest)
+
+        if uploaded_file is None:
+            image_bytes = encode_image(image, "JPEG", digest=digest)
+            if not image_bytes:
+                raise ValueError("Failed to convert image to bytes")
+
+            if not self.upload_images:
+                return types.Part.from_bytes(data=image_bytes, mime_type="image/jpeg")
+
+            uploaded_file = self.client.files.upload(
+                file=BytesIO(image_bytes),
+                config=types.UploadFileConfig(mime_type="image/jpeg"),
             )
-            raise RuntimeError("LLM API call failed") from e
+            with self._uploaded_files_lock:
+                self._uploaded_files[digest] = uploaded_file
+                while len(self._uploaded_files) > UPLOADED_FILES_CACHE_SIZE:
+                    self._uploaded_files.popitem(last=False)
+            logger.debug("Uploaded image to the Gemini Files API")
+
+        if not uploaded_file.uri:
+            raise ValueError("Uploaded image file has no URI")
+
+        return types.Part.from_uri(
+            file_uri=uploaded_file.uri,
+            mime_type=uploaded_file.mime_type or "image/jpeg",
+        )
 
     def __repr__(self) -> str:
         return f"GeminiLLM(model_name={self.model_name})"
@@ -5,10 +5,13 @@ This module provides the orchestrator class, driving the generator and evaluator
 interactions to generate high-quality weather chart descriptions.
 """
 
-import earthkit.data as ekd
-import earthkit.plots as ekp
+import asyncio
+import logging
 
-from PIL.ImageFile import ImageFile
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from PIL import Image
 
 from earth_reach.config.logging import get_logger
 from earth_reach.core.evaluator import CriterionEvaluatorOutput, EvaluatorAgent
@@ -17,6 +20,11 @@ from earth_reach.core.extractors.base_extractor import (
 )
 from earth_reach.core.generator import GeneratorAgent, GeneratorOutput
 from earth_reach.core.prompts.orchestrator import get_default_feedback_template
+from earth_reach.core.utils import figure_to_image
+
+if TYPE_CHECKING:
+    import earthkit.data as ekd
+    import earthkit.plots as ekp
 
 logger = get_logger(__name__)
 
@@ -66,16 +74,16 @@ class Orchestrator:
 
     def run(
         self,
-        figure: ekp.Figure | None = None,
-        image: ImageFile | None = None,
-        data: ekd.FieldList | None = None,
+        figure: "ekp.Figure | None" = None,
+        image: Image.Image | None = None,
+        data: "ekd.FieldList | None" = None,
     ) -> str:
         """
         Run the iterative process of generating and evaluating a weather chart description until quality criteria are met.
 
         Args:
             figure (Figure | None): Optional figure to use to generate a description. Can't be used with image.
-            image (ImageFile | None): Optional image to use to generate a description (will be converted to base64). Can't be used with figure.
+            image (Image.Image | None): Optional image to use to generate a description (will be converted to base64). Can't be used with figure.
             data (FieldList | None): Optional data to use to generate a description.
 
         Returns:
@@ -84,98 +92,265 @@ class Orchestrator:
         Raises:
             RuntimeError: if an error occurs during description generation
         """
-        if figure is not None and image is not None:
-            raise ValueError(
-                "Only one of 'figure' or 'image' can be provided, not both.",
-            )
-
+        image = self._prepare_image(figure, image)
         if data is not None and self.data_extractors:
-            logger.info("Enriching prompts with data extractors...")
-            for extractor in self.data_extractors:
-                try:
-                    features = extractor.extract(data)
-                    features_str = extractor.format_features_to_str(features)
-                    self._add_data_features_to_agent_prompt(
-                        features_str, agent="generator"
-                    )
-                    self._add_data_features_to_agent_prompt(
-                        features_str, agent="evaluator"
-                    )
-                except Exception:
-                    continue
+            self._enrich_prompts_with_data_features(data)
 
         try:
-            description: str | GeneratorOutput = ""
+            description = ""
             evaluation: list[CriterionEvaluatorOutput] = []
             for i in range(self.max_iterations):
                 logger.info(
                     "Starting orchestration iteration %d/%d", i + 1, self.max_iterations
                 )
-                description = self.generator_agent.generate(
-                    figure=figure,
-                    image=image,
-                    return_intermediate_steps=False,
-                )
-                if not isinstance(description, str):
-                    raise TypeError(
-                        f"Expected description to be a string, got {type(description)}",
+                description = self._check_description(
+                    self.generator_agent.generate(
+                        image=image,
+                        return_intermediate_steps=False,
                     )
+                )
+                evaluation = self.evaluator_agent.evaluate(description, image=image)
+                if self._process_evaluation(i, description, evaluation):
+                    return description
+
+            return self._finalize_description(description, evaluation)
+        except Exception as e:
+            raise RuntimeError("Failed to generate a description") from e
 
-                if not description:
-                    raise ValueError("Generated description is empty.")
+    async def arun(
+        self,
+        figure: "ekp.Figure | None" = None,
+        image: Image.Image | None = None,
+        data: "ekd.FieldList | None" = None,
+    ) -> str:
+        """
+        Asynchronously run the iterative process of generating and evaluating a weather chart description.
+
+        Data extractors run in a worker thread, and all evaluation criteria are
+        requested concurrently.
+
+        Args:
+            figure (Figure | None): Optional figure to use to generate a description. Can't be used with image.
+            image (Image.Image | None): Optional image to use to generate a description (will be converted to base64). Can't be used with figure.
+            data (FieldList | None): Optional data to use to generate a description.
+
+        Returns:
+            str: The final weather description.
+
+        Raises:
+            RuntimeError: if an error occurs during description generation
+        """
+        image = self._prepare_image(figure, image)
+        if data is not None and self.data_extractors:
+            await asyncio.to_thread(self._enrich_prompts_with_data_features, data)
 
-                evaluation = self.evaluator_agent.evaluate(
+        try:
+            description = ""
+            evaluation: list[CriterionEvaluatorOutput] = []
+            for i in range(self.max_iterations):
+                logger.info(
+                    "Starting orchestration iteration %d/%d", i + 1, self.max_iterations
+                )
+                description = self._check_description(
+                    await self.generator_agent.agenerate(
+                        image=image,
+                        return_intermediate_steps=False,
+                    )
+                )
+                evaluation = await self.evaluator_agent.aevaluate(
                     description,
                     image=image,
-                    figure=figure,
                 )
-
-                if self._verify_evaluation_passes(evaluation):
-                    logger.info(
-                        "All criteria met, orchestration completed successfully",
-                        extra={
-                            "description_length": len(description),
-                            "iteration": i + 1,
-                            "final_scores": {
-                                eval_result.name: eval_result.score
-                                for eval_result in evaluation
-                            },
-                        },
-                    )
+                if self._process_evaluation(i, description, evaluation):
                     return description
 
-                unmet_criteria = [
-                    c for c in evaluation if c.score < self.criteria_threshold
-                ]
-                logger.debug(
-                    "Providing feedback for iteration %d",
-                    i + 1,
-                    extra={
-                        "iteration": i + 1,
-                        "unmet_criteria": [c.name for c in unmet_criteria],
-                        "unmet_scores": {c.name: c.score for c in unmet_criteria},
-                    },
-                )
-                self._provide_feedback_to_generator(i + 1, description, evaluation)
+            return self._finalize_description(description, evaluation)
+        except Exception as e:
+            raise RuntimeError("Failed to generate a description") from e
 
+    def _prepare_image(
+        self,
+        figure: "ekp.Figure | None",
+        image: Image.Image | None,
+    ) -> Image.Image | None:
+        """
+        Render the figure once for all iterations, after adding its metadata to the agent prompts.
+
+        Args:
+            figure (Figure | None): Optional figure to render. Can't be used with image.
+            image (Image.Image | None): Optional image to use as is. Can't be used with figure.
+
+        Returns:
+            Image.Image | None: The image to send to the agents.
+
+        Raises:
+            ValueError: If both figure and image are provided.
+        """
+        if figure is not None and image is not None:
+            raise ValueError(
+                "Only one of 'figure' or 'image' can be provided, not both.",
+            )
+
+        if figure is None:
+            return image
+
+        self.generator_agent.add_figure_metadata(figure)
+        self.evaluator_agent.add_figure_metadata(figure)
+        return figure_to_image(
+            figure,
+            max_side=self.generator_agent.llm.max_image_side,
+        )
+
+    def _enrich_prompts_with_data_features(self, data: "ekd.FieldList") -> None:
+        """
+        Add the features extracted from the data to the agent prompts.
+
+        Args:
+            data (FieldList): The data to extract features from
+        """
+        logger.info("Enriching prompts with data extractors...")
+        for features_str in self._extract_data_features(data):
+            if features_str is None:
+                continue
+            self._add_data_features_to_agent_prompt(features_str, agent="generator")
+            self._add_data_features_to_agent_prompt(features_str, agent="evaluator")
+
+    def _check_description(self, description: str | GeneratorOutput) -> str:
+        """
+        Check that the generator returned a non-empty description.
+
+        Args:
+            description (str | GeneratorOutput): The generator output
+
+        Returns:
+            str: The description
+
+        Raises:
+            TypeError: If the description is not a string
+            ValueError: If the description is empty
+        """
+        if not isinstance(description, str):
+            raise TypeError(
+                f"Expected description to be a string, got {type(description)}",
+            )
+
+        if not description:
+            raise ValueError("Generated description is empty.")
+
+        return description
+
+    def _process_evaluation(
+        self,
+        iteration: int,
+        description: str,
+        evaluation: list[CriterionEvaluatorOutput],
+    ) -> bool:
+        """
+        Check the evaluation of an iteration, providing feedback to the generator if it fails
+        and another iteration remains.
+
+        Args:
+            iteration (int): The zero-based index of the iteration
+            description (str): The description generated by the GeneratorAgent
+            evaluation (List[CriterionEvaluatorOutput]): Evaluation results from the EvaluatorAgent
+
+        Returns:
+            bool: True if all criteria are met, False otherwise
+        """
+        if self._verify_evaluation_passes(evaluation):
             logger.info(
-                "Maximum iterations %d reached without passing evaluation. Acknowledging limits of description.",
-                self.max_iterations,
+                "All criteria met, orchestration completed successfully",
+                extra={
+                    "description_length": len(description),
+                    "iteration": iteration + 1,
+                    "final_scores": {
+                        eval_result.name: eval_result.score
+                        for eval_result in evaluation
+                    },
+                },
             )
+            return True
+
+        if iteration + 1 >= self.max_iterations:
+            # No further generation would use the feedback
+            return False
+
+        if logger.isEnabledFor(logging.DEBUG):
+            unmet_criteria = [
+                c for c in evaluation if c.score < self.criteria_threshold
+            ]
+            logger.debug(
+                "Providing feedback for iteration %d",
+                iteration + 1,
+                extra={
+                    "iteration": iteration + 1,
+                    "unmet_criteria": [c.name for c in unmet_criteria],
+                    "unmet_scores": {c.name: c.score for c in unmet_criteria},
+                },
+            )
+        self._provide_feedback_to_generator(iteration + 1, description, evaluation)
+        return False
+
+    def _finalize_description(
+        self,
+        description: str,
+        evaluation: list[CriterionEvaluatorOutput],
+    ) -> str:
+        """
+        Return the last description once the maximum number of iterations is reached.
+
+        Args:
+            description (str): The last description generated by the GeneratorAgent
+            evaluation (List[CriterionEvaluatorOutput]): Its evaluation results
+
+        Returns:
+            str: The description with acknowledgment of its limits added
+
+        Raises:
+            ValueError: If the description is empty
+        """
+        logger.info(
+            "Maximum iterations %d reached without passing evaluation. Acknowledging limits of description.",
+            self.max_iterations,
+        )
+
+        if not description:
+            raise ValueError("Final generated description is empty.")
+
+        return self._acknowledge_limits_of_description(
+            description,
+            evaluation,
+        )
+
+    def _extract_data_features(self, data: "ekd.FieldList") -> list[str | None]:
+        """
+        Run all data extractors concurrently on the data.
+
+        Args:
+            data (FieldList): The data to extract features from
 
-            if not isinstance(description, str):
-                raise TypeError(
-                    f"Expected description to be a string, got {type(description)}",
+        Returns:
+            list[str | None]: String formatted features of each extractor, in the order of
+                the extractors, or None for extractors that failed
+        """
+
+        def _extract(extractor: BaseDataExtractor) -> str | None:
+            try:
+                features = extractor.extract(data)
+                return extractor.format_features_to_str(features)
+            except Exception as e:
+                logger.warning(
+                    "Data extractor %s failed, skipping its features: %s",
+                    type(extractor).__name__,
+                    e,
                 )
-            if not description:
-                raise ValueError("Final generated description is empty.")
+                return None
 
-            return self._acknowledge_limits_of_description(
-                description,
-                evaluation,
-            )
-        except Exception as e:
-            raise RuntimeError("Failed to generate a description") from e
+        if len(self.data_extractors) == 1:
+            return [_extract(self.data_extractors[0])]
+
+        with ThreadPoolExecutor(max_workers=len(self.data_extractors)) as executor:
+            return list(executor.map(_extract, self.data_extractors))
 
     def _add_data_features_to_agent_prompt(self, features: str, agent: str) -> None:
         """Add extracted data features to end of agent prompt
@@ -5,21 +5,261 @@ Provides utility functions for image processing, file path operations,
 and data format conversions.
 """
 
-import base64
+import hashlib
+import re
+import threading
 
+from collections import OrderedDict
+from collections.abc import Iterable
 from io import BytesIO
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from PIL.ImageFile import ImageFile
+import numpy as np
 
+from PIL import Image
 
-def img_to_base64(image_path: str | None = None, img: ImageFile | None = None) -> str:
+try:
+    # SIMD-accelerated drop-in replacement for the standard library encoder
+    from pybase64 import b64encode  # type: ignore
+except ImportError:
+    from base64 import b64encode  # type: ignore
+
+try:
+    # Non-cryptographic hash, several times faster than SHA-256 for cache keys
+    from xxhash import xxh3_128 as _key_hasher  # type: ignore
+except ImportError:
+    from hashlib import sha256 as _key_hasher  # type: ignore
+
+if TYPE_CHECKING:
+    import earthkit.plots as ekp
+
+MAX_IMAGE_SIDE = 1024
+RESIZE_REDUCING_GAP = 3.0
+ENCODED_IMAGE_CACHE_SIZE = 32
+JPEG_QUALITY = 90
+PNG_COMPRESS_LEVEL = 1
+
+_encoded_image_cache: OrderedDict[tuple[str, str], bytes] = OrderedDict()
+_encoded_image_cache_lock = threading.Lock()
+
+
+def figure_to_image(
+    figure: "ekp.Figure",
+    max_side: int | None = None,
+) -> Image.Image:
+    """
+    Render an earthkit-plots figure to an in-memory image.
+
+    The figure is rasterized from its Agg canvas buffer, on a temporary Agg canvas if
+    it uses another backend. Figures larger than max_side are rendered at a lower DPI.
+
+    Args:
+        figure (ekp.Figure): The figure to render.
+        max_side (int | None): Optional maximum length in pixels of the longest side
+            of the rendered image.
+
+    Returns:
+        Image.Image: The rendered figure, in RGB mode.
+
+    Raises:
+        ValueError: If the figure has no underlying matplotlib figure.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    figure._release_queue()
+
+    plt_fig = figure.fig
+    if plt_fig is None:
+        raise ValueError("Matplotlib figure is None, cannot render it to an image.")
+
+    if max_side is not None and max_side <= 0:
+        raise ValueError("max_side must be greater than 0")
+
+    original_dpi = plt_fig.dpi
+    longest_side_inches = max(plt_fig.get_size_inches())
+    render_dpi = original_dpi
+    if max_side is not None and longest_side_inches * original_dpi > max_side:
+        render_dpi = max_side / longest_side_inches
+
+    original_canvas = plt_fig.canvas
+    if isinstance(original_canvas, FigureCanvasAgg):
+        canvas = original_canvas
+    else:
+        canvas = FigureCanvasAgg(plt_fig)
+
+    try:
+        if render_dpi != original_dpi:
+            plt_fig.dpi = render_dpi
+        canvas.draw()
+        rgb = np.ascontiguousarray(np.asarray(canvas.buffer_rgba())[..., :3])
+    finally:
+        if render_dpi != original_dpi:
+            plt_fig.dpi = original_dpi
+        if canvas is not original_canvas:
+            plt_fig.set_canvas(original_canvas)
+
+    return Image.fromarray(rgb)
+
+
+def downscale_image(img: Image.Image, max_side: int = MAX_IMAGE_SIDE) -> Image.Image:
+    """
+    Downscale an image so that its longest side does not exceed max_side.
+
+    Large reductions first shrink the image by an integer factor with a box filter,
+    before the final Lanczos pass.
+
+    Args:
+        img (Image.Image): The image to downscale.
+        max_side (int): Maximum length in pixels of the longest side of the image.
+
+    Returns:
+        Image.Image: The downscaled image, or the original image if it already fits.
+    """
+    if max_side <= 0:
+        raise ValueError("max_side must be greater than 0")
+
+    width, height = img.size
+    if max(width, height) <= max_side:
+        return img
+
+    scale = max_side / max(width, height)
+    size = (max(1, round(width * scale)), max(1, round(height * scale)))
+    return img.resize(size, Image.Resampling.LANCZOS, reducing_gap=RESIZE_REDUCING_GAP)
+
+
+def image_digest(img: Image.Image) -> str:
+    """
+    Compute a content hash of an image.
+
+    Args:
+        img (Image.Image): The image to hash.
+
+    Returns:
+        str: The SHA-256 hex digest of the image mode, size and pixel data.
+    """
+    hasher = hashlib.sha256(f"{img.mode}:{img.size}".encode())
+    hasher.update(img.tobytes())
+    return hasher.hexdigest()
+
+
+def hash_key(*parts: str) -> str:
+    """
+    Compute a cache key from string parts, stable across processes.
+
+    Args:
+        *parts (str): The strings identifying the cached value.
+
+    Returns:
+        str: The hex digest of the parts.
+    """
+    hasher = _key_hasher()
+    for part in parts:
+        hasher.update(part.encode())
+        hasher.update(b"\0")
+    return hasher.hexdigest()
+
+
+def compile_tags_pattern(tag_names: Iterable[str]) -> re.Pattern[str]:
+    """
+    Compile a pattern matching any of the given XML tags, for use with extract_tags.
+
+    Args:
+        tag_names (Iterable[str]): The names of the tags to match.
+
+    Returns:
+        re.Pattern[str]: The compiled pattern, capturing the tag name and its content.
+    """
+    names = "|".join(re.escape(name) for name in tag_names)
+    return re.compile(rf"<({names})>(.*?)</\1>", re.DOTALL)
+
+
+def extract_tags(text: str, pattern: re.Pattern[str]) -> dict[str, str]:
+    """
+    Extract the stripped content of XML tags from a text in a single scan.
+
+    Only the first occurrence of each tag is kept, and tags whose content is empty
+    are left out.
+
+    Args:
+        text (str): The text containing the XML tags, e.g. an LLM response.
+        pattern (re.Pattern[str]): The tags pattern, as built by compile_tags_pattern.
+
+    Returns:
+        dict[str, str]: The content of each tag found, keyed by tag name.
+    """
+    contents: dict[str, str] = {}
+    seen: set[str] = set()
+    for match in pattern.finditer(text):
+        name = match.group(1)
+        if name in seen:
+            continue
+        seen.add(name)
+        content = match.group(2).strip()
+        if content:
+            contents[name] = content
+    return contents
+
+
+def encode_image(
+    img: Image.Image,
+    image_format: str = "PNG",
+    digest: str | None = None,
+) -> bytes:
+    """
+    Encode an image to the given format, reusing previous encodings of the same content.
+
+    Encoded images are memoized in a small LRU cache keyed by their content hash.
+
+    Args:
+        img (Image.Image): The image to encode.
+        image_format (str): The PIL format name to encode the image to.
+        digest (str | None): The image content hash, if the caller already computed it.
+
+    Returns:
+        bytes: The encoded image.
+    """
+    key = (digest or image_digest(img), image_format.upper())
+    with _encoded_image_cache_lock:
+        if key in _encoded_image_cache:
+            _encoded_image_cache.move_to_end(key)
+            return _encoded_image_cache[key]
+
+    if image_format.upper() == "JPEG":
+        bytes_io = BytesIO()
+        rgb_img = img if img.mode in ("RGB", "L") else img.convert("RGB")
+        rgb_img.save(bytes_io, format="JPEG", quality=JPEG_QUALITY, optimize=True)
+        encoded = bytes_io.getvalue()
+    elif image_format.upper() == "PNG":
+        bytes_io = BytesIO()
+        img.save(bytes_io, format="PNG", compress_level=PNG_COMPRESS_LEVEL)
+        encoded = bytes_io.getvalue()
+    else:
+        bytes_io = BytesIO()
+        img.save(bytes_io, format=image_format)
+        encoded = bytes_io.getvalue()
+
+    with _encoded_image_cache_lock:
+        _encoded_image_cache[key] = encoded
+        while len(_encoded_image_cache) > ENCODED_IMAGE_CACHE_SIZE:
+            _encoded_image_cache.popitem(last=False)
+
+    return encoded
+
+
+def img_to_base64(
+    image_path: str | None = None,
+    img: Image.Image | None = None,
+    image_format: str = "PNG",
+) -> str:
     """
     Convert an image to a base64 string.
 
     Args:
         image_path (str): The path to the image file. Either this or img must be provided.
-        img (ImageFile | None): The image object. Either this or image_path must be provided.
+        img (Image.Image | None): The image object. Either this or image_path must be provided.
+        image_format (str): The PIL format name to encode img to. Files read from
+            image_path are encoded as they are.
 
     Returns:
         str: The base64 string representation of the image.
@@ -28,20 +268,18 @@ def img_to_base64(image_path: str | None = None, img: ImageFile | None = None) -
         raise ValueError("Either image_path or img must be provided.")
 
     if img is not None:
-        bytes_io = BytesIO()
-        img.save(bytes_io, format="PNG")
-        return base64.b64encode(bytes_io.getvalue()).decode("utf-8")
+        return b64encode(encode_image(img, image_format)).decode("ascii")
 
     with open(image_path, "rb") as img_file:  # type: ignore
-        return base64.b64encode(img_file.read()).decode("utf-8")
+        return b64encode(img_file.read()).decode("ascii")
 
 
-def img_to_bytes(img: ImageFile) -> bytes:
+def img_to_bytes(img: Image.Image) -> bytes:
     """
     Convert a PIL Image to bytes for Gemini API.
 
     Args:
-        img: ImageFile object
+        img: Image object
 
     Returns:
         bytes: Image as bytes
@@ -49,9 +287,7 @@ def img_to_bytes(img: ImageFile) -> bytes:
     if img is None:
         raise ValueError("Image cannot be None")
 
-    bytes_io = BytesIO()
-    img.save(bytes_io, format="PNG")
-    return bytes_io.getvalue()
+    return encode_image(img, "PNG")
 
 
 def get_root_dir_path() -> Path:
@@ -5,23 +5,29 @@ Contains the main EarthReachAgent class that serves as the primary
 entry point for the dual-LLM weather chart description framework.
 """
 
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from typing import Any
 
 import earthkit.data as ekd
 import earthkit.plots as ekp
+from PIL import Image
 
 from earth_reach.config.criteria import QualityCriteria
 from earth_reach.config.logging import get_logger
+from earth_reach.core.cache import CachedLLM
 from earth_reach.core.evaluator import EvaluatorAgent
 from earth_reach.core.extractors.base_extractor import BaseDataExtractor
 from earth_reach.core.extractors.pressure_extractor import PressureCenterDataExtractor
 from earth_reach.core.generator import GeneratorAgent
-from earth_reach.core.llm import create_llm
+from earth_reach.core.llm import LLMInterface, create_llm
 from earth_reach.core.orchestrator import Orchestrator
 from earth_reach.core.prompts.generator import get_default_generator_user_prompt
+from earth_reach.core.utils import figure_to_image
 
 logger = get_logger(__name__)
 
+MAX_PENDING_RENDERS_PER_WORKER = 2
+
 
 class EarthReachAgent:
     """
@@ -40,6 +46,7 @@ class EarthReachAgent:
         model_name: str | None = None,
         max_iterations: int = 3,
         criteria_threshold: int = 4,
+        cache_dir: str | None = None,
     ) -> None:
         """
         Initialize the EarthReachAgent with LLM provider and configuration parameters.
@@ -49,12 +56,16 @@ class EarthReachAgent:
             model_name: Specific model name to use (optional, uses provider default)
             max_iterations: Maximum number of iterations for the orchestrator
             criteria_threshold: Minimum score for evaluation criteria to pass
+            cache_dir: Directory where LLM responses are cached, so that re-running the
+                same charts doesn't call the LLM API again (optional, no caching by default)
         """
         self.provider = provider
         self.model_name = model_name
+        self.cache_dir = cache_dir
         self.required_vars = {"2t", "msl"}
         self.max_iterations = max_iterations
         self.criteria_threshold = criteria_threshold
+        self._llm: LLMInterface | None = None
         logger.info(
             "EarthReachAgent initialized with provider=%s, model=%s, max_iterations=%d, criteria_threshold=%d",
             provider,
@@ -63,7 +74,7 @@ class EarthReachAgent:
             criteria_threshold,
         )
 
-    def _validate_inputs(self, figure: Any, data: Any) -> None:
+    def _validate_inputs(self, figure: Any, data: Any) -> set[str]:
         """
         Validate that inputs are of the correct types and contain required data.
 
@@ -71,6 +82,9 @@ class EarthReachAgent:
             figure: Should be an earthkit.plots.Figure object
             data: Should be an earthkit.data.FieldList object
 
+        Returns:
+            Set of variables available in the data, empty if they could not be read
+
         Raises:
             TypeError: If inputs are not of the expected types
             ValueError: If required variables are missing from data
@@ -83,26 +97,26 @@ class EarthReachAgent:
         if not isinstance(data, ekd.FieldList):
             raise TypeError(f"Expected earthkit.data.FieldList, got {type(data)}")
 
-        available_vars = set()
         try:
-            for field in data:
-                param = field.metadata("param")
-                if param:
-                    available_vars.add(param)
+            available_vars = {param for param in data.metadata("param") if param}
         except Exception as e:
             logger.warning("Could not extract parameter metadata from data: %s", e)
-            return
+            return set()
 
         missing_vars = self.required_vars - available_vars
         if missing_vars:
             raise ValueError(f"Required variables missing from data: {missing_vars}")
 
-    def _create_data_extractors(self, data: ekd.FieldList) -> list[BaseDataExtractor]:
+        return available_vars
+
+    def _create_data_extractors(
+        self, available_vars: set[str]
+    ) -> list[BaseDataExtractor]:
         """
         Create appropriate data extractors based on available variables in the data.
 
         Args:
-            data: FieldList containing GRIB data
+            available_vars: Set of variables available in the data, as returned by _validate_inputs
 
         Returns:
             List of data extractor instances
@@ -111,13 +125,7 @@ class EarthReachAgent:
             RuntimeError: If extractor creation fails
         """
         logger.debug("Creating data extractors...")
-        extractors = []
-
-        available_vars = set()
-        for field in data:
-            param = field.metadata("param")
-            if param:
-                available_vars.add(param)
+        extractors: list[BaseDataExtractor] = []
 
         if "msl" in available_vars:
             try:
@@ -129,6 +137,24 @@ class EarthReachAgent:
         logger.info("Created %d data extractors", len(extractors))
         return extractors
 
+    def _get_llm(self) -> LLMInterface:
+        """
+        Get the LLM shared by all the descriptions generated by this agent.
+
+        The LLM is created on first use.
+
+        Returns:
+            The LLM instance, wrapped in a response cache if a cache directory is set
+        """
+        if self._llm is None:
+            llm: LLMInterface = create_llm(
+                provider=self.provider, model_name=self.model_name
+            )
+            if self.cache_dir is not None:
+                llm = CachedLLM(llm, cache_dir=self.cache_dir)
+            self._llm = llm
+        return self._llm
+
     def _setup_components(
         self, data_extractors: list[BaseDataExtractor]
     ) -> Orchestrator:
@@ -146,7 +172,7 @@ class EarthReachAgent:
         """
         try:
             logger.debug("Initializing components...")
-            llm = create_llm(provider=self.provider, model_name=self.model_name)
+            llm = self._get_llm()
 
             generator = GeneratorAgent(
                 llm=llm,
@@ -195,11 +221,11 @@ class EarthReachAgent:
         try:
             logger.info("Starting description generation...")
 
-            self._validate_inputs(figure, data)
+            available_vars = self._validate_inputs(figure, data)
 
             if use_extractors:
                 logger.info("Creating data extractors to enrich prompts")
-                data_extractors = self._create_data_extractors(data)
+                data_extractors = self._create_data_extractors(available_vars)
             else:
                 data_extractors = []
 
@@ -208,17 +234,110 @@ class EarthReachAgent:
             logger.info("Running orchestrated description generation...")
             description = orchestrator.run(figure=figure, data=data)
 
-            if not isinstance(description, str):
-                raise TypeError(f"Expected string description, got {type(description)}")
+            return self._check_description(description)
 
-            if not description.strip():
-                raise ValueError("Generated description is empty")
+        except (TypeError, ValueError) as e:
+            logger.error("Input validation or data error: %s", e)
+            raise
+        except RuntimeError as e:
+            logger.error("Runtime error during generation: %s", e)
+            raise
+        except Exception as e:
+            logger.error("Unexpected error during description generation: %s", e)
+            raise RuntimeError(f"Failed to generate description: {e}") from e
 
-            logger.info(
-                "Description generation completed successfully (length: %d characters)",
-                len(description),
-            )
-            return description.strip()
+    def generate_alt_descriptions(
+        self,
+        items: list[tuple[ekp.Figure, ekd.FieldList]],
+        use_extractors: bool = False,
+        max_workers: int = 4,
+        return_exceptions: bool = False,
+    ) -> list[str | Exception]:
+        """
+        Generate alternative text descriptions for several weather charts.
+
+        Figures are rendered one after the other in the calling thread, and then
+        orchestrated in a thread pool. Rendering pauses while too many rendered figures
+        are waiting for a worker.
+
+        Args:
+            items: List of (figure, data) pairs to describe
+            use_extractors: Whether to use data extractors to enrich prompts or not. Default to False
+            max_workers: Maximum number of descriptions generated concurrently. Default to 4
+            return_exceptions: Whether to return the exception of a failed generation in
+                place of its description, instead of raising it and discarding the
+                descriptions of the other items. Default to False
+
+        Returns:
+            List of descriptions, in the same order as the input items
+
+        Raises:
+            TypeError: If inputs are not of the expected types
+            ValueError: If required data is missing or invalid
+            RuntimeError: If description generation fails
+        """
+        if max_workers <= 0:
+            raise ValueError("max_workers must be greater than 0")
+        if not items:
+            return []
+
+        try:
+            logger.info("Starting generation of %d descriptions...", len(items))
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                try:
+                    results: list[Future[str] | Exception] = []
+                    in_flight: set[Future[str]] = set()
+                    for i, (figure, data) in enumerate(items):
+                        max_pending = max_workers * MAX_PENDING_RENDERS_PER_WORKER
+                        if len(in_flight) >= max_pending:
+                            _, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+
+                        try:
+                            orchestrator, image = self._prepare_item(
+                                figure, data, use_extractors
+                            )
+                        except Exception as e:
+                            if not return_exceptions:
+                                raise
+                            logger.warning(
+                                "Failed to prepare description %d/%d: %s",
+                                i + 1,
+                                len(items),
+                                e,
+                            )
+                            results.append(e)
+                            continue
+
+                        future = executor.submit(
+                            orchestrator.run, image=image, data=data
+                        )
+                        results.append(future)
+                        in_flight.add(future)
+
+                    descriptions: list[str | Exception] = []
+                    for i, result in enumerate(results):
+                        if isinstance(result, Exception):
+                            descriptions.append(result)
+                            continue
+                        try:
+                            descriptions.append(
+                                self._check_description(result.result())
+                            )
+                        except Exception as e:
+                            if not return_exceptions:
+                                raise
+                            logger.warning(
+                                "Failed to generate description %d/%d: %s",
+                                i + 1,
+                                len(items),
+                                e,
+                            )
+                            descriptions.append(e)
+                    return descriptions
+                except BaseException:
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
 
         except (TypeError, ValueError) as e:
             logger.error("Input validation or data error: %s", e)
@@ -228,4 +347,65 @@ class EarthReachAgent:
             raise
         except Exception as e:
             logger.error("Unexpected error during description generation: %s", e)
-            raise RuntimeError(f"Failed to generate description: {e}") from e
+            raise RuntimeError(f"Failed to generate descriptions: {e}") from e
+
+    def _prepare_item(
+        self,
+        figure: ekp.Figure,
+        data: ekd.FieldList,
+        use_extractors: bool,
+    ) -> tuple[Orchestrator, Image.Image]:
+        """
+        Validate a (figure, data) pair, and set up its orchestrator and rendered image.
+
+        Args:
+            figure: Earthkit-plots figure object
+            data: Earthkit-data FieldList containing the plotted data
+            use_extractors: Whether to use data extractors to enrich prompts or not
+
+        Returns:
+            Tuple of the configured orchestrator and the rendered figure
+
+        Raises:
+            TypeError: If inputs are not of the expected types
+            ValueError: If required data is missing or invalid
+            RuntimeError: If component setup fails
+        """
+        available_vars = self._validate_inputs(figure, data)
+        data_extractors = (
+            self._create_data_extractors(available_vars) if use_extractors else []
+        )
+        orchestrator = self._setup_components(data_extractors)
+        orchestrator.generator_agent.add_figure_metadata(figure)
+        orchestrator.evaluator_agent.add_figure_metadata(figure)
+        image = figure_to_image(
+            figure,
+            max_side=orchestrator.generator_agent.llm.max_image_side,
+        )
+        return orchestrator, image
+
+    def _check_description(self, description: Any) -> str:
+        """
+        Check that the orchestrator returned a non-empty description.
+
+        Args:
+            description: Description returned by the orchestrator
+
+        Returns:
+            The stripped description
+
+        Raises:
+            TypeError: If the description is not a string
+            ValueError: If the description is empty
+        """
+        if not isinstance(description, str):
+            raise TypeError(f"Expected string description, got {type(description)}")
+
+        if not description.strip():
+            raise ValueError("Generated description is empty")
+
+        logger.info(
+            "Description generation completed successfully (length: %d characters)",
+            len(description),
+        )
+        return description.strip()
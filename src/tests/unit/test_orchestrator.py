@@ -0,0 +1,90 @@
+"""Unit tests for the orchestrator."""
+
+from types import SimpleNamespace
+from typing import Any
+
+from matplotlib.figure import Figure
+from PIL import Image
+
+from earth_reach.core.evaluator import EvaluatorAgent
+from earth_reach.core.extractors.base_extractor import BaseDataExtractor
+from earth_reach.core.generator import GeneratorAgent
+from earth_reach.core.llm import LLMInterface
+from earth_reach.core.orchestrator import Orchestrator
+
+GENERATOR_RESPONSE = "".join(
+    f"<{tag}>Low pressure over the North Sea.</{tag}>"
+    for tag in (
+        "step_1",
+        "step_2",
+        "step_3",
+        "step_4",
+        "step_5",
+        "final_description",
+    )
+)
+
+
+class FakeLLM(LLMInterface):
+    """LLM returning canned generator and evaluator responses, recording the prompts."""
+
+    def __init__(self) -> None:
+        self.user_prompts: list[str] = []
+
+    @property
+    def provider_name(self) -> str:
+        return "fake"
+
+    def generate(
+        self,
+        user_prompt: str,
+        system_prompt: str | None = None,
+        image: Image.Image | None = None,
+    ) -> str:
+        self.user_prompts.append(user_prompt)
+        if "# Description to evaluate" in user_prompt:
+            return "<score>5</score><reasoning>Accurate.</reasoning>"
+        return GENERATOR_RESPONSE
+
+
+class FakeExtractor(BaseDataExtractor):
+    """Extractor returning a fixed feature, whatever the data."""
+
+    def validate_data(self, data: Any) -> Any:
+        return data
+
+    def extract(self, data: Any, **kwargs: Any) -> list[Any]:
+        return ["deep low"]
+
+    def format_features_to_str(self, features: list[Any]) -> str:
+        return f"## Fake Extractor Output\n\n{', '.join(features)}"
+
+
+def make_figure() -> Any:
+    """Build a stand-in for an earthkit-plots figure around a matplotlib figure."""
+    fig = Figure(figsize=(4, 3), dpi=50)
+    fig.add_subplot().set_title("Mean sea level pressure")
+    return SimpleNamespace(fig=fig, _domain="Europe", _release_queue=lambda: None)
+
+
+def test_run_with_figure_and_extractor() -> None:
+    llm = FakeLLM()
+    orchestrator = Orchestrator(
+        generator_agent=GeneratorAgent(
+            llm=llm,
+            system_prompt=None,
+            user_prompt="Describe the chart.",
+        ),
+        evaluator_agent=EvaluatorAgent(criteria=["coherence", "fluency"], llm=llm),
+        data_extractors=[FakeExtractor()],
+        max_iterations=1,
+    )
+
+    data: Any = object()
+    description = orchestrator.run(figure=make_figure(), data=data)
+
+    assert description == "Low pressure over the North Sea."
+    assert len(llm.user_prompts) == 3
+    for user_prompt in llm.user_prompts:
+        assert "Mean sea level pressure" in user_prompt
+        assert "## Fake Extractor Output" in user_prompt
@@ -0,0 +1,64 @@
+"""Unit tests for the pressure centers data extractor."""
+
+import numpy as np
+import pytest
+
+from earth_reach.core.extractors.pressure_extractor import (
+    PressureCenter,
+    PressureCenterDataExtractor,
+)
+
+
+@pytest.fixture
+def extractor(monkeypatch: pytest.MonkeyPatch) -> PressureCenterDataExtractor:
+    """Extractor reading a synthetic field with one low and one high pressure center."""
+    lats, lons = np.meshgrid(
+        np.linspace(60.0, 40.0, 5),
+        np.linspace(-10.0, 20.0, 7),
+        indexing="ij",
+    )
+    rows, cols = np.indices(lats.shape)
+    pressure = (
+        1010.0
+        - 20.0 * np.exp(-((rows - 1) ** 2 + (cols - 1) ** 2) / 2.0)
+        + 25.0 * np.exp(-((rows - 3) ** 2 + (cols - 5) ** 2) / 2.0)
+    )
+
+    extractor = PressureCenterDataExtractor()
+    monkeypatch.setattr(extractor, "validate_data", lambda data: (pressure, lats, lons))
+    return extractor
+
+
+def test_extract_finds_low_and_high_centers(
+    extractor: PressureCenterDataExtractor,
+) -> None:
+    centers = extractor.extract(data=None)  # type: ignore[arg-type]
+
+    lows = [center for center in centers if center.center_type == "low"]
+    highs = [center for center in centers if center.center_type == "high"]
+    assert len(lows) == 1
+    assert len(highs) == 1
+
+    assert lows[0].grid_indices == (1, 1)
+    assert lows[0].latitude == pytest.approx(55.0)
+    assert lows[0].longitude == pytest.approx(-5.0)
+    assert lows[0].center_value_hPa < 1010.0
+
+    assert highs[0].grid_indices == (3, 5)
+    assert highs[0].latitude == pytest.approx(45.0)
+    assert highs[0].longitude == pytest.approx(15.0)
+    assert highs[0].center_value_hPa > 1010.0
+
+
+def test_extract_returns_python_scalars(
+    extractor: PressureCenterDataExtractor,
+) -> None:
+    centers = extractor.extract(data=None)  # type: ignore[arg-type]
+
+    assert centers
+    for center in centers:
+        assert isinstance(center, PressureCenter)
+        assert type(center.latitude) is float
+        assert type(center.longitude) is float
+        assert type(center.center_value_hPa) is float
+        assert all(type(index) is int for index in center.grid_indices)